@@ -1 +1,17 @@
+import numpy as np
+
 DEFAULT_SOUND_SPEED = 343.2
+
+# Floating-point dtype of audio signals, spectra and NMF factors. Set to np.float32 before loading
+# audio to halve memory usage and speed up FFT and BLAS operations.
+DTYPE = np.float64
+
+
+def get_complex_dtype() -> np.dtype:
+    """
+    Get the complex dtype matching the configured floating-point dtype.
+
+    Returns:
+        np.dtype: complex64 if DTYPE is float32, complex128 if DTYPE is float64.
+    """
+    return np.result_type(DTYPE, np.complex64)
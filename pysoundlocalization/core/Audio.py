@@ -4,6 +4,9 @@ import os
 import soundfile as sf
 import sounddevice as sd
 from datetime import timedelta
+from numpy.lib.stride_tricks import as_strided, sliding_window_view
+import pysoundlocalization.config as config
+from pysoundlocalization.preprocessing.PolyphaseResampler import PolyphaseResampler
 
 
 class Audio:
@@ -13,26 +16,61 @@ class Audio:
         convert_to_sample_rate: int = None,
         audio_signal: np.ndarray = None,
         sample_rate: int = None,
+        lazy: bool = False,
+        copy: bool = True,
     ):
         """
         Initialize the Audio class with a specific audio file path.
         This class supports audio formats supported by soundfile, like WAV, FLAC, AIFF, OGG, etc.
 
+        In lazy mode, only the metadata of the file is read at construction. Chunks and sample ranges are read
+        on demand, and uncompressed WAV files are memory-mapped, such that only the accessed pages are loaded.
+        The entire audio signal is loaded on first access to it, e.g. by get_audio_signal_unchunked().
+
         Args:
             filepath (str | None): Path to the audio file.
             convert_to_sample_rate (int | None): Desired sampling rate of the audio signal in Hz to which the audio will be converted.
             audio_signal (np.ndarray): The audio signal data as a numpy array.
             sample_rate (int): The sample rate in Hz.
+            lazy (bool): Read the audio file on demand instead of loading it at construction. Defaults to False.
+            copy (bool): If True, the given audio signal is never modified: it is copied before the first in-place
+                change of a chunk (copy-on-write). If False, in-place changes are written to the given array, which
+                is how the channels of a MultichannelAudio share its buffer. Defaults to True.
         """
         self.__filepath = filepath
         self.__convert_to_sample_rate = convert_to_sample_rate
-        self.__audio_signal = [audio_signal]
+        # The audio signal is kept as a single 1-D array. If it is chunked, its length is a
+        # multiple of the chunk size and the chunks are exposed as a strided view into it.
+        self.__audio_signal = (
+            None
+            if audio_signal is None
+            else np.asarray(audio_signal, dtype=config.DTYPE)
+        )
+        # Whether the audio signal may be changed in place, i.e. it is not (possibly) the array of a caller
+        self.__owns_audio_signal = (
+            not copy
+            or audio_signal is None
+            or not np.may_share_memory(self.__audio_signal, audio_signal)
+        )
+        self.__chunk_samples: int | None = None
         self.__sample_rate = sample_rate
-        if audio_signal is None and sample_rate is None:
+
+        # Metadata and memory map of a lazily loaded audio file
+        self.__num_frames: int | None = None
+        self.__memmap: np.memmap | None = None
+
+        if lazy:
+            if convert_to_sample_rate is not None:
+                raise ValueError(
+                    "Lazy loading cannot be combined with a sample rate conversion."
+                )
+            self.__open_lazy(filepath=filepath)
+        elif audio_signal is None and sample_rate is None:
             self.load_audio_file(filepath=filepath)
 
-        if self.__audio_signal[0].ndim > 1:
-            self.__audio_signal[0] = np.mean(self.__audio_signal[0], axis=1)
+        if self.__audio_signal is not None and self.__audio_signal.ndim > 1:
+            self.__audio_signal = np.mean(self.__audio_signal, axis=1)
+            self.__owns_audio_signal = True
 
         print(f"Audio object created from {filepath}")
 
@@ -51,10 +89,89 @@ class Audio:
         return cls(audio_signal=audio_signal, sample_rate=sample_rate)
 
     def __str__(self):
-        chunks = len(self.__audio_signal)
+        chunks = self.get_num_chunks()
         return f"Audio(filepath={self.__filepath}, sample_rate={self.__sample_rate}, chunks={chunks}, duration={self.get_duration()}s, audio_signal={self.__audio_signal})"
 
-    def load_audio_file(self, filepath: str = None) -> tuple[int, list[np.ndarray]]:
+    def __open_lazy(self, filepath: str) -> None:
+        """
+        Read the metadata of the audio file and memory-map its samples if it is an uncompressed WAV file.
+
+        Args:
+            filepath (str): The path to the audio file.
+
+        Raises:
+            FileNotFoundError: If no valid file path is provided or the file does not exist.
+        """
+        if not filepath or not os.path.exists(filepath):
+            raise FileNotFoundError(
+                f"No valid audio file provided or file not found: {filepath}"
+            )
+
+        info = sf.info(filepath)
+        self.__sample_rate = info.samplerate
+        self.__num_frames = info.frames
+
+        dtype = _WAV_MEMMAP_DTYPES.get(info.subtype)
+        offset = _find_wav_data_offset(filepath) if info.format == "WAV" else None
+        if dtype is not None and offset is not None:
+            self.__memmap = np.memmap(
+                filepath,
+                dtype=dtype,
+                mode="r",
+                offset=offset,
+                shape=(info.frames, info.channels),
+            )
+
+    def __load_lazy(self) -> None:
+        """
+        Load the entire audio signal of a lazily opened audio file, keeping its chunking.
+        """
+        chunk_samples = self.__chunk_samples
+        self.__audio_signal = self.read_samples(start=0, stop=self.__num_frames)
+        self.__owns_audio_signal = True
+        self.__memmap = None
+        self.__num_frames = None
+        self.__chunk_samples = None
+        if chunk_samples is not None:
+            self.chunk_audio_signal_by_samples(chunk_samples=chunk_samples)
+
+    def read_samples(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """
+        Return the samples of the (unchunked) audio signal between the start and stop sample index.
+
+        If the audio is lazily opened and not loaded yet, only the requested samples are read from the file.
+
+        Args:
+            start (int): The start sample index. Defaults to 0.
+            stop (int | None): The end sample index (exclusive). Defaults to the end of the audio signal.
+
+        Returns:
+            np.ndarray: The audio signal data between start and stop as a numpy array.
+        """
+        if self.__audio_signal is not None:
+            return self.__audio_signal[start:stop]
+
+        start, stop, _ = slice(start, stop).indices(self.__num_frames)
+        stop = max(start, stop)
+        if self.__memmap is not None:
+            samples = np.asarray(self.__memmap[start:stop], dtype=config.DTYPE)
+            if self.__memmap.dtype == np.uint8:
+                samples = (samples - 128) / 128
+            elif np.issubdtype(self.__memmap.dtype, np.integer):
+                samples /= -float(np.iinfo(self.__memmap.dtype).min)
+        else:
+            samples, _ = sf.read(
+                self.__filepath,
+                start=start,
+                stop=stop,
+                always_2d=True,
+                dtype=np.dtype(config.DTYPE).name,
+            )
+
+        # Mix multichannel audio down to mono
+        return np.mean(samples, axis=1)
+
+    def load_audio_file(self, filepath: str = None) -> tuple[int, np.ndarray]:
         """
         Manually load the audio file from the filepath. May be used to re-load the file from the filepath.
 
@@ -75,51 +192,75 @@ class Audio:
                 f"No valid audio file provided or file not found: {filepath}"
             )
 
-        # Load the audio file using soundfile
-        audio_signal, self.__sample_rate = sf.read(filepath)
-        self.__audio_signal = [audio_signal]
+        # Load the audio file using soundfile and mix multichannel audio down to mono
+        audio_signal, self.__sample_rate = sf.read(
+            filepath, dtype=np.dtype(config.DTYPE).name
+        )
+        if audio_signal.ndim > 1:
+            audio_signal = np.mean(audio_signal, axis=1)
+        self.__audio_signal = audio_signal
+        self.__owns_audio_signal = True
+        self.__chunk_samples = None
+        self.__memmap = None
+        self.__num_frames = None
 
         # If desired sample rate is provided, convert audio to new sample rate
         if (
             self.__convert_to_sample_rate is not None
             and self.__sample_rate != self.__convert_to_sample_rate
         ):
-            self.__audio_signal = self.resample_audio()
-            self.__sample_rate = self.__convert_to_sample_rate
+            self.resample_audio()
 
-        return self.__sample_rate, self.__audio_signal
+        return self.__sample_rate, self.get_audio_signal_chunked()
 
-    def resample_audio(self, target_rate: int | None = None) -> list[np.ndarray]:
+    def resample_audio(
+        self, target_rate: int | None = None, backend: str = "librosa"
+    ) -> np.ndarray:
         """
-        Resamples the audio signal to the desired sampling rate.
+        Resamples the audio signal to the desired sampling rate. If the audio signal is chunked, each chunk is resampled separately.
 
         Args:
             target_rate (int): The desired sampling rate of the resampled audio signal
+            backend (str): "librosa" uses librosa.resample, "polyphase" uses a PolyphaseResampler with a cached filter. Defaults to "librosa".
 
         Returns:
-            list[np.ndarray]: The resampled audio signal as a list of numpy arrays
+            np.ndarray: The resampled audio signal chunks as a 2-D array of shape (n_chunks, chunk_samples)
         """
 
+        if backend not in ("librosa", "polyphase"):
+            raise ValueError(
+                f"Unknown backend '{backend}'. Use 'librosa' or 'polyphase'."
+            )
+
         if target_rate is None:
             target_rate = self.__convert_to_sample_rate
 
         if self.__sample_rate == target_rate:
-            return self.__audio_signal
+            return self.get_audio_signal_chunked()
 
         print(f"Resampling audio from {self.__sample_rate} Hz to {target_rate} Hz...")
 
-        self.__audio_signal = [
-            librosa.resample(signal, orig_sr=self.__sample_rate, target_sr=target_rate)
-            for signal in self.__audio_signal
-        ]
+        if backend == "polyphase":
+            resampled = PolyphaseResampler(
+                orig_sr=self.__sample_rate, target_sr=target_rate
+            ).resample(self.get_audio_signal_chunked())
+        else:
+            resampled = librosa.resample(
+                self.get_audio_signal_chunked(),
+                orig_sr=self.__sample_rate,
+                target_sr=target_rate,
+                axis=-1,
+            )
+        self.__audio_signal = resampled.astype(config.DTYPE, copy=False).reshape(-1)
+        self.__owns_audio_signal = True
+        if self.__chunk_samples is not None:
+            self.__chunk_samples = resampled.shape[1]
 
         self.__sample_rate = target_rate
 
-        return self.__audio_signal
+        return self.get_audio_signal_chunked()
 
-    def convert_to_sample_rate(
-        self, target_sample_rate: int
-    ) -> tuple[int, list[np.ndarray]]:
+    def convert_to_sample_rate(self, target_sample_rate: int) -> tuple[int, np.ndarray]:
         """
         Converts the audio to the desired sample rate.
 
@@ -130,9 +271,8 @@ class Audio:
             tuple[int, np.ndarray]: The converted sample rate (Hz) and audio signal (numpy array).
         """
         if self.__sample_rate != target_sample_rate:
-            self.__audio_signal = self.resample_audio(target_rate=target_sample_rate)
-            self.__sample_rate = target_sample_rate
-        return self.__sample_rate, self.__audio_signal
+            self.resample_audio(target_rate=target_sample_rate)
+        return self.__sample_rate, self.get_audio_signal_chunked()
 
     def chunk_audio_signal_by_duration(
         self, chunk_duration: timedelta | None = timedelta(milliseconds=1000)
@@ -150,21 +290,84 @@ class Audio:
         """
         Core implementation to chunk the audio signal by desired samples per chunk.
 
+        The chunks are a strided view into the contiguous audio signal, so chunking does not copy the
+        signal unless its last chunk has to be zero-padded to the full chunk size.
+
         Args:
             chunk_samples (int): The number of samples in each chunk. The sample rate of the audio defines how many samples are in a given timeframe.
         """
-        if len(self.__audio_signal) > 1:
+        if self.get_num_chunks() > 1:
             raise ValueError("Audio signal is already chunked. Cannot chunk it again.")
 
-        chunks = []
-        for i in range(0, len(self.__audio_signal[0]), chunk_samples):
-            next_chunk = self.__audio_signal[0][i : i + chunk_samples]
-            if len(next_chunk) == chunk_samples:
-                chunks.append(next_chunk)
-            else:
-                chunks.append(np.pad(next_chunk, (0, chunk_samples - len(next_chunk))))
+        if chunk_samples <= 0:
+            raise ValueError("The number of samples per chunk must be positive.")
+
+        # A lazily opened audio signal is zero-padded when chunks are read
+        if self.__audio_signal is None:
+            self.__chunk_samples = chunk_samples
+            return
+
+        # Zero-pad the last chunk to the full chunk size
+        remainder = len(self.__audio_signal) % chunk_samples
+        if remainder != 0:
+            self.__audio_signal = np.pad(
+                self.__audio_signal, (0, chunk_samples - remainder)
+            )
+            self.__owns_audio_signal = True
+
+        self.__chunk_samples = chunk_samples
+
+    def get_frames(self, frame_samples: int, hop_samples: int) -> np.ndarray:
+        """
+        Return overlapping frames of the (unchunked) audio signal as a read-only strided view.
+
+        The frames share the memory of the audio signal, so even a large overlap does not increase memory usage.
+        Samples after the last full frame are not part of any frame.
+
+        Args:
+            frame_samples (int): The number of samples in each frame.
+            hop_samples (int): The number of samples between the starts of consecutive frames.
+
+        Returns:
+            np.ndarray: A view of the frames of shape (n_frames, frame_samples).
+        """
+        if frame_samples <= 0 or hop_samples <= 0:
+            raise ValueError("The frame and hop size must be positive.")
+
+        signal = self.get_audio_signal_unchunked()
+        if len(signal) < frame_samples:
+            raise ValueError(
+                f"The audio signal has {len(signal)} samples, which is less than one frame of {frame_samples} samples."
+            )
+
+        return sliding_window_view(signal, frame_samples)[::hop_samples]
+
+    def get_frames_by_duration(
+        self, frame_duration: timedelta, hop_duration: timedelta
+    ) -> np.ndarray:
+        """
+        Return overlapping frames of the (unchunked) audio signal as a read-only strided view.
+
+        Args:
+            frame_duration (timedelta): The duration of each frame.
+            hop_duration (timedelta): The time between the starts of consecutive frames.
+
+        Returns:
+            np.ndarray: A view of the frames of shape (n_frames, frame_samples).
+        """
+        return self.get_frames(
+            frame_samples=int(self.__sample_rate * frame_duration.total_seconds()),
+            hop_samples=int(self.__sample_rate * hop_duration.total_seconds()),
+        )
+
+    def is_loaded(self) -> bool:
+        """
+        Check whether the audio signal is in memory, i.e. not a lazily opened audio file that has not been loaded yet.
 
-        self.__audio_signal = chunks
+        Returns:
+            bool: True if the audio signal is loaded.
+        """
+        return self.__audio_signal is not None
 
     def get_filepath(self) -> str:
         """
@@ -185,31 +388,50 @@ class Audio:
         Returns:
             np.ndarray: The audio signal data as a numpy array.
         """
-        if self.__audio_signal is None:
-            self.load_audio_file()
-
-        # Return entire audio signal if no index is specified. If audio signal was chunked, concatenate and return.
+        # Return entire audio signal if no index is specified
         if index is None:
             return self.get_audio_signal_unchunked()
-        return self.__audio_signal[index]
 
-    def get_audio_signal_chunked(self) -> list[np.ndarray]:
+        # Read only the requested chunk of a lazily opened audio signal
+        if self.__audio_signal is None:
+            chunk_samples = self.__chunk_samples or self.__num_frames
+            if not 0 <= index < self.get_num_chunks():
+                raise IndexError(f"Chunk index {index} is out of range.")
+            chunk = self.read_samples(
+                start=index * chunk_samples, stop=(index + 1) * chunk_samples
+            )
+            return np.pad(chunk, (0, chunk_samples - len(chunk)))
+
+        return self.get_audio_signal_chunked()[index]
+
+    def get_audio_signal_chunked(self) -> np.ndarray:
         """
-        Return the list of chunked audio signals of the audio file.
+        Return the chunked audio signal of the audio file. If the audio signal is not chunked, it is returned as a single chunk.
 
         Returns:
-            list[np.ndarray]: The list of audio signal data as numpy arrays.
+            np.ndarray: A view of the audio signal data of shape (n_chunks, chunk_samples).
         """
         if self.__audio_signal is None:
-            self.load_audio_file()
-
-        return self.__audio_signal
+            self.__load_lazy()
+
+        signal = self.__audio_signal
+        chunk_samples = self.__chunk_samples or len(signal)
+        stride = signal.strides[0]
+        return as_strided(
+            signal,
+            shape=(len(signal) // max(chunk_samples, 1), chunk_samples),
+            strides=(chunk_samples * stride, stride),
+            writeable=signal.flags.writeable,
+        )
 
     def get_audio_signal_unchunked(self) -> np.ndarray:
         """
-        Return the audio_signal as a single (unchunked) numpy array. If the audio_signal is a list of audio signal chunks, converts it to a single concatenated audio signal.
+        Return the audio_signal as a single (unchunked) numpy array. If the audio_signal is chunked, the chunks are contiguous in the returned array.
         """
-        return np.concatenate(self.__audio_signal)
+        if self.__audio_signal is None:
+            self.__load_lazy()
+
+        return self.__audio_signal
 
     def set_audio_signal(
         self, audio_signal: np.ndarray, index: int | None = None
@@ -219,12 +441,47 @@ class Audio:
 
         Args:
             audio_signal (np.ndarray): The audio signal data as a numpy array.
-            index (int): The index of the audio signal in the list of audio signals.
+            index (int): The index of the chunk to replace. If None, the entire (unchunked) audio signal is replaced.
+
+        Raises:
+            ValueError: If the replaced chunk has a different number of samples than the new audio signal.
         """
         if index is None:
-            self.__audio_signal = [audio_signal]
-        else:
-            self.__audio_signal[index] = audio_signal
+            self.__audio_signal = np.asarray(audio_signal, dtype=config.DTYPE)
+            self.__owns_audio_signal = False
+            self.__chunk_samples = None
+            self.__memmap = None
+            self.__num_frames = None
+            return
+
+        chunk = self.get_audio_signal_chunked()[index]
+        if len(audio_signal) != len(chunk):
+            raise ValueError(
+                f"Chunk {index} has {len(chunk)} samples, but the new audio signal has {len(audio_signal)} samples."
+            )
+
+        # Copy-on-write, such that the array of a caller is never changed in place
+        if not self.__owns_audio_signal or not self.__audio_signal.flags.writeable:
+            self.__audio_signal = self.__audio_signal.copy()
+            self.__owns_audio_signal = True
+        self.get_audio_signal_chunked()[index] = audio_signal
+
+    def set_audio_signal_chunked(self, audio_signal_chunked: np.ndarray) -> None:
+        """
+        Set the audio signal data from an array of chunks, e.g. the processed result of get_audio_signal_chunked().
+
+        Args:
+            audio_signal_chunked (np.ndarray): The audio signal chunks as a 2-D array of shape (n_chunks, chunk_samples).
+                A single row sets an unchunked audio signal.
+        """
+        if audio_signal_chunked.ndim != 2:
+            raise ValueError(
+                "Audio signal chunks must be a 2-D array of shape (n_chunks, chunk_samples)."
+            )
+
+        self.set_audio_signal(audio_signal=audio_signal_chunked.reshape(-1))
+        if audio_signal_chunked.shape[0] > 1:
+            self.__chunk_samples = audio_signal_chunked.shape[1]
 
     def get_sample_rate(self) -> int:
         """
@@ -240,6 +497,15 @@ class Audio:
             self.load_audio_file()
         return self.__sample_rate
 
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """
+        Set the sample rate of the audio signal, without resampling it.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+        """
+        self.__sample_rate = sample_rate
+
     def get_num_samples(self) -> int:
         """
         Get the total number of samples in the audio signal.
@@ -247,7 +513,12 @@ class Audio:
         Returns:
             int: The number of samples in the audio signal.
         """
-        return self.get_audio_signal_unchunked().shape[0]
+        if self.__audio_signal is None:
+            if self.__chunk_samples is None:
+                return self.__num_frames
+            # Account for the zero-padding of the last chunk
+            return -(-self.__num_frames // self.__chunk_samples) * self.__chunk_samples
+        return len(self.__audio_signal)
 
     def get_num_chunks(self) -> int:
         """
@@ -256,7 +527,9 @@ class Audio:
         Returns:
             int: The number of chunks the audio signal was split into.
         """
-        return len(self.__audio_signal)
+        if self.__chunk_samples is None:
+            return 1
+        return self.get_num_samples() // self.__chunk_samples
 
     def get_duration(self) -> float:
         """
@@ -268,9 +541,7 @@ class Audio:
         Raises:
             ValueError: If the audio signal has not been loaded yet.
         """
-        if self.__audio_signal is None:
-            self.load_audio_file()
-        return len(self.get_audio_signal_unchunked()) / self.__sample_rate
+        return self.get_num_samples() / self.__sample_rate
 
     def max_amplitude(self) -> float:
         """
@@ -299,14 +570,10 @@ class Audio:
         Raises:
             ValueError: If the audio signal has not been loaded yet.
         """
-        if self.__audio_signal is None:
-            self.load_audio_file()
-
         print("Playing audio...")
 
-        for chunk in self.__audio_signal:
-            sd.play(chunk, self.__sample_rate)
-            sd.wait()
+        sd.play(self.get_audio_signal_unchunked(), self.__sample_rate)
+        sd.wait()
 
     def export(self, output_filepath: str) -> None:
         """
@@ -320,13 +587,13 @@ class Audio:
             ValueError: If the audio signal is not loaded.
             RuntimeError: If the export fails for any reason.
         """
-        if not self.__audio_signal:
+        if self.get_num_samples() == 0:
             raise ValueError(
                 "An audio signal must be loaded before it can be exported."
             )
 
-        # Concatenate all audio chunks into one signal
-        combined_signal = np.concatenate(self.__audio_signal)
+        # The audio chunks are contiguous in the audio signal
+        combined_signal = self.get_audio_signal_unchunked()
 
         # Create directory if not exists yet
         directory = os.path.dirname(output_filepath)
@@ -339,3 +606,41 @@ class Audio:
             print(f"Audio successfully exported to {output_filepath}")
         except Exception as e:
             raise RuntimeError(f"Failed to export audio: {e}")
+
+
+# NumPy dtypes of the WAV subtypes that can be memory-mapped
+_WAV_MEMMAP_DTYPES = {
+    "PCM_U8": np.dtype("u1"),
+    "PCM_16": np.dtype("<i2"),
+    "PCM_32": np.dtype("<i4"),
+    "FLOAT": np.dtype("<f4"),
+    "DOUBLE": np.dtype("<f8"),
+}
+
+
+def _find_wav_data_offset(filepath: str) -> int | None:
+    """
+    Find the byte offset of the sample data in a RIFF/WAVE file.
+
+    Args:
+        filepath (str): The path to the WAV file.
+
+    Returns:
+        int | None: The byte offset of the "data" chunk payload, or None if the file is not a plain RIFF/WAVE file.
+    """
+    with open(filepath, "rb") as file:
+        header = file.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+
+        # Iterate over the chunks of the file until the data chunk is found
+        while True:
+            chunk_header = file.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:], "little")
+            if chunk_id == b"data":
+                return file.tell()
+            # Chunks are padded to an even number of bytes
+            file.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
@@ -1,15 +1,32 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import timedelta
-from itertools import combinations
+from itertools import combinations, repeat
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
+import soundfile as sf
+from scipy.signal import get_window
 import pysoundlocalization.config as config
-from pysoundlocalization.localization.multilateration import multilaterate_by_tdoa_pairs
+from pysoundlocalization.localization.multilateration import (
+    multilaterate_batch,
+    multilaterate_by_tdoa_pairs,
+)
 from pysoundlocalization.core.Microphone import Microphone
+from pysoundlocalization.core.MultichannelAudio import MultichannelAudio
+from pysoundlocalization.core.TdoaGrid import TdoaGrid
+from pysoundlocalization.core.TdoaPair import TdoaPair
 from pysoundlocalization.visualization.environment_plot import environment_plot
 from pysoundlocalization.localization.tdoa_gcc_phat import (
-    get_all_tdoa_of_chunk_index_by_gcc_phat,
+    get_all_tdoa_of_signals_by_gcc_phat,
 )
 from pysoundlocalization.localization.tdoa_threshold import (
-    get_all_tdoa_of_chunk_index_by_threshold,
+    get_all_tdoa_of_signals_by_threshold,
+)
+from pysoundlocalization.localization.srp_phat import (
+    compute_steering_matrix,
+    cross_spectra,
+    steered_power,
 )
 
 
@@ -35,6 +52,9 @@ class Environment:
         )
         self.__mics: list[Microphone] = []
         self.__sound_source_position: tuple[float, float] | None = None
+        self.__tdoa_grid: TdoaGrid | None = None
+        self.__srp_phat_grid: TdoaGrid | None = None
+        self.__srp_phat_steering: tuple[tuple[int, int], np.ndarray] | None = None
 
     def add_microphone(
         self, x: float, y: float, name: str | None = None
@@ -186,14 +206,40 @@ class Environment:
         algorithm: str = "threshold",
         threshold: float | None = 0.5,
         debug: bool | None = False,
+        solver: str = "least_squares",
+        workers: int | None = None,
+        batch_size: int | None = None,
+        executor: str = "thread",
+        frame_duration: timedelta | None = None,
+        hop_duration: timedelta | None = None,
+        window: str | tuple | None = None,
     ) -> dict:
         """
         Localizes the sound source of the loaded audio signals.
 
+        Chunks are independent of each other. If `workers` is set, the chunks are split into batches
+        that are localized concurrently. With the "thread" executor, all workers share the audio of the
+        environment directly. With the "process" executor, the environment is sent once to each worker
+        process when the pool starts, and the tasks only carry chunk indices. Scripts using the "process"
+        executor must guard their entry point with `if __name__ == "__main__":`.
+
+        If `frame_duration` is set, the chunking of the audio signals is ignored, and the sound source is localized
+        in (possibly overlapping) frames that are strided views into the audio signals, see Audio.get_frames().
+
         Args:
-            algorithm (str): The algorithm to use for computing the TDoA values.
+            algorithm (str): The algorithm to use for computing the TDoA values. With "srp_phat", the steered response
+                power is evaluated over the grid of get_srp_phat_steering() instead, and the solver is not used.
             threshold (float): The threshold for the audio signal.
             debug (bool): Print debug information if True.
+            solver (str): The multilateration solver backend, see multilaterate_by_tdoa_pairs(). With "closed_form" or
+                "gauss_newton", all chunks (of a batch) are solved in one vectorized call. With "grid", all chunks are
+                matched against the precomputed TDoA grid of get_tdoa_grid(). Defaults to "least_squares".
+            workers (int | None): Number of workers localizing chunks concurrently. Chunks are localized serially if None.
+            batch_size (int | None): Number of chunks per task. Defaults to splitting the chunks into four batches per worker.
+            executor (str): Either "thread" or "process". Defaults to "thread".
+            frame_duration (timedelta | None): The duration of each frame. If None, the chunks of the audio signals are localized.
+            hop_duration (timedelta | None): The time between the starts of consecutive frames. Defaults to frame_duration.
+            window (str | tuple | None): Window function applied to each frame, as accepted by scipy.signal.get_window() (e.g. "hann"). Defaults to None.
 
         Returns:
             dict: A dictionary containing the estimated (x, y) coordinates at given sample indices of the sound source
@@ -203,33 +249,730 @@ class Environment:
         if len(self.get_mics()) < 2:
             raise ValueError("At least two microphones are needed to localize.")
 
-        num_chunks = len(self.get_mics()[0].get_audio().get_audio_signal_chunked())
-        chunk_size = int(self.get_mics()[0].get_audio().get_num_samples() / num_chunks)
+        frame_samples = None
+        hop_samples = None
+        if frame_duration is not None:
+            sample_rate = self.get_lowest_sample_rate()
+            frame_samples = int(sample_rate * frame_duration.total_seconds())
+            hop_samples = frame_samples
+            if hop_duration is not None:
+                hop_samples = int(sample_rate * hop_duration.total_seconds())
+            num_chunks = min(
+                len(
+                    mic.get_audio().get_frames(
+                        frame_samples=frame_samples, hop_samples=hop_samples
+                    )
+                )
+                for mic in self.__mics
+            )
+            chunk_size = hop_samples
+            if window is not None:
+                window = get_window(window, frame_samples)
+        else:
+            if window is not None:
+                raise ValueError("A window function requires a frame_duration.")
+            num_chunks = self.get_mics()[0].get_audio().get_num_chunks()
+            chunk_size = int(
+                self.get_mics()[0].get_audio().get_num_samples() / num_chunks
+            )
+        chunk_indices = list(range(num_chunks))
+
+        if workers is None or workers <= 1:
+            positions = self._localize_chunks(
+                chunk_indices=chunk_indices,
+                algorithm=algorithm,
+                threshold=threshold,
+                debug=debug,
+                solver=solver,
+                frame_samples=frame_samples,
+                hop_samples=hop_samples,
+                window=window,
+            )
+        else:
+            # Build the cached grid or steering matrix once, instead of in every worker
+            if algorithm == "srp_phat":
+                self.get_srp_phat_steering(sample_rate=self.get_lowest_sample_rate())
+            elif solver == "grid":
+                self.get_tdoa_grid()
+
+            if batch_size is None:
+                batch_size = max(1, int(np.ceil(num_chunks / (workers * 4))))
+            batches = [
+                chunk_indices[start : start + batch_size]
+                for start in range(0, num_chunks, batch_size)
+            ]
+
+            if executor == "thread":
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = pool.map(
+                        lambda batch: self._localize_chunks(
+                            chunk_indices=batch,
+                            algorithm=algorithm,
+                            threshold=threshold,
+                            debug=debug,
+                            solver=solver,
+                            frame_samples=frame_samples,
+                            hop_samples=hop_samples,
+                            window=window,
+                        ),
+                        batches,
+                    )
+                    positions = [position for batch in results for position in batch]
+            elif executor == "process":
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_localize_worker,
+                    initargs=(self,),
+                ) as pool:
+                    results = pool.map(
+                        _localize_chunks_in_worker,
+                        batches,
+                        repeat(algorithm),
+                        repeat(threshold),
+                        repeat(debug),
+                        repeat(solver),
+                        repeat(frame_samples),
+                        repeat(hop_samples),
+                        repeat(window),
+                    )
+                    positions = [position for batch in results for position in batch]
+            else:
+                raise ValueError(
+                    f"Unknown executor '{executor}'. Use 'thread' or 'process'."
+                )
 
         dict = {}
-        for i in range(num_chunks):
-            tdoa_pairs_of_chunk = None
+        for i, sound_source_position in zip(chunk_indices, positions):
+            dict[f"{i * chunk_size}"] = sound_source_position
+
+        return dict
+
+    def _localize_chunks(
+        self,
+        chunk_indices: list[int],
+        algorithm: str = "threshold",
+        threshold: float | None = 0.5,
+        debug: bool | None = False,
+        solver: str = "least_squares",
+        frame_samples: int | None = None,
+        hop_samples: int | None = None,
+        window: np.ndarray | None = None,
+    ) -> list[tuple[float, float] | None]:
+        """
+        Localizes the sound source in each of the given chunks.
+
+        Args:
+            chunk_indices (list[int]): The indices of the chunks (or frames) to localize.
+            algorithm (str): The algorithm to use for computing the TDoA values.
+            threshold (float): The threshold for the audio signal.
+            debug (bool): Print debug information if True.
+            solver (str): The multilateration solver backend, see multilaterate_by_tdoa_pairs(). Defaults to "least_squares".
+            frame_samples (int | None): The number of samples per frame. If None, the chunks of the audio signals are localized.
+            hop_samples (int | None): The number of samples between the starts of consecutive frames.
+            window (np.ndarray | None): Window function applied to each frame. Defaults to None.
+
+        Returns:
+            list[tuple[float, float] | None]: The estimated (x, y) coordinates for each chunk, or None if the chunk has no TDoA.
+        """
+        sample_rate = self.get_lowest_sample_rate()
+        max_tau = self.get_max_tau()
+
+        if algorithm == "srp_phat":
+            signals = np.stack(
+                [
+                    self.__get_chunk_signals(
+                        index=i,
+                        frame_samples=frame_samples,
+                        hop_samples=hop_samples,
+                        window=window,
+                    )
+                    for i in chunk_indices
+                ]
+            )
+            return self.__localize_by_srp_phat(
+                signals=signals,
+                sample_rate=sample_rate,
+                threshold=threshold,
+                debug=debug,
+            )
+
+        tdoa_pairs_of_chunks = []
+        for i in chunk_indices:
+            signals = self.__get_chunk_signals(
+                index=i,
+                frame_samples=frame_samples,
+                hop_samples=hop_samples,
+                window=window,
+            )
+            tdoa_pairs_of_chunks.append(
+                self.__compute_tdoa_pairs(
+                    signals=signals,
+                    sample_rate=sample_rate,
+                    max_tau=max_tau,
+                    algorithm=algorithm,
+                    threshold=threshold,
+                    debug=debug,
+                )
+            )
+
+        return self.__multilaterate(
+            tdoa_pairs_of_chunks=tdoa_pairs_of_chunks, solver=solver
+        )
+
+    def __get_chunk_signals(
+        self,
+        index: int,
+        frame_samples: int | None = None,
+        hop_samples: int | None = None,
+        window: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Stacks the audio signals of all microphones in a single chunk or frame.
+
+        Args:
+            index (int): The index of the chunk (or frame).
+            frame_samples (int | None): The number of samples per frame. If None, the chunk at the index is returned.
+            hop_samples (int | None): The number of samples between the starts of consecutive frames.
+            window (np.ndarray | None): Window function applied to the frame. Defaults to None.
+
+        Returns:
+            np.ndarray: The audio signals as a 2-D array of shape (n_mics, n_samples).
+        """
+        # If the audio signals of all mics are rows of one array, slice all of them at once
+        shared_signals = self.__get_shared_audio_signals()
+        if shared_signals is not None:
+            if frame_samples is None:
+                audio = self.__mics[0].get_audio()
+                frame_samples = audio.get_num_samples() // audio.get_num_chunks()
+                hop_samples = frame_samples
+            start = index * hop_samples
+            signals = shared_signals[:, start : start + frame_samples].copy()
+
+        # Be aware that if audio signals are not the same length, the chunking can result
+        # that we have different amount of chunks per mic. This can lead to problems here.
+        # Therefore, make sure that audio signals have identical length in the preprocessing step.
+        elif frame_samples is None:
+            signals = np.stack(
+                [mic.get_audio().get_audio_signal(index=index) for mic in self.__mics]
+            )
+        else:
+            signals = np.stack(
+                [
+                    mic.get_audio().get_frames(
+                        frame_samples=frame_samples, hop_samples=hop_samples
+                    )[index]
+                    for mic in self.__mics
+                ]
+            )
+
+        if window is not None:
+            signals *= window
+
+        return signals
+
+    def set_multichannel_audio(self, multichannel_audio: MultichannelAudio) -> None:
+        """
+        Assign the channels of a multichannel audio to the microphones, in the order of the microphones.
+
+        Args:
+            multichannel_audio (MultichannelAudio): The multichannel audio with one channel per microphone.
+        """
+        if multichannel_audio.get_num_channels() != len(self.__mics):
+            raise ValueError(
+                f"Expected {len(self.__mics)} channels, one per microphone, got {multichannel_audio.get_num_channels()}."
+            )
+
+        for mic, audio in zip(self.__mics, multichannel_audio.get_channels()):
+            mic.set_audio(audio)
+
+    def get_stacked_audio_signals(self) -> np.ndarray:
+        """
+        Get the (unchunked) audio signals of all microphones as one array.
+
+        If the audio signals of the microphones are rows of one array, e.g. the channels of a MultichannelAudio,
+        a view of this array is returned. Otherwise, the audio signals are copied into a new array.
+
+        Returns:
+            np.ndarray: The audio signals as a 2-D array of shape (n_mics, n_samples).
+        """
+        shared_signals = self.__get_shared_audio_signals()
+        if shared_signals is not None:
+            return shared_signals
+
+        return np.stack(
+            [mic.get_audio().get_audio_signal_unchunked() for mic in self.__mics]
+        )
+
+    def set_stacked_audio_signals(self, audio_signals: np.ndarray) -> None:
+        """
+        Set the (unchunked) audio signals of all microphones from one array. The audio signal of each
+        microphone becomes a view of its row, and any chunking of the audio signals is reset.
+
+        Args:
+            audio_signals (np.ndarray): The audio signals as a 2-D array of shape (n_mics, n_samples).
+        """
+        if audio_signals.ndim != 2 or audio_signals.shape[0] != len(self.__mics):
+            raise ValueError(
+                f"Audio signals must be a 2-D array with one row per microphone ({len(self.__mics)})."
+            )
+
+        audio_signals = np.ascontiguousarray(audio_signals, dtype=config.DTYPE)
+        for mic, audio_signal in zip(self.__mics, audio_signals):
+            mic.get_audio().set_audio_signal(audio_signal=audio_signal)
+
+    def __get_shared_audio_signals(self) -> np.ndarray | None:
+        """
+        Get a 2-D view of the audio signals of all microphones, if they are equally spaced rows of one array.
+
+        Returns:
+            np.ndarray | None: The audio signals of shape (n_mics, n_samples), or None if they do not share one array.
+        """
+        audios = [mic.get_audio() for mic in self.__mics]
+        if not audios or not all(
+            audio is not None and audio.is_loaded() for audio in audios
+        ):
+            return None
+
+        signals = [audio.get_audio_signal_unchunked() for audio in audios]
+        first = signals[0]
+        if len(signals) == 1:
+            return first[np.newaxis]
+
+        address = first.__array_interface__["data"][0]
+        row_stride = signals[1].__array_interface__["data"][0] - address
+        if row_stride == 0:
+            return None
+
+        root = _get_root_array(first)
+        for k, signal in enumerate(signals):
+            if (
+                signal.shape != first.shape
+                or signal.strides != first.strides
+                or signal.dtype != first.dtype
+                or signal.__array_interface__["data"][0] != address + k * row_stride
+                or _get_root_array(signal) is not root
+            ):
+                return None
+
+        return as_strided(
+            first,
+            shape=(len(signals), len(first)),
+            strides=(row_stride, first.strides[0]),
+            writeable=first.flags.writeable,
+        )
+
+    def iter_localize(
+        self,
+        filepaths: list[str] | None = None,
+        chunk_duration: timedelta = timedelta(milliseconds=1000),
+        algorithm: str = "threshold",
+        threshold: float | None = 0.5,
+        debug: bool | None = False,
+        solver: str = "least_squares",
+    ) -> Iterator[tuple[int, tuple[float, float] | None]]:
+        """
+        Localizes the sound source block by block while reading the audio files of the microphones.
+
+        Only one block per microphone is held in memory at any time, so arbitrarily long recordings can be
+        processed at constant memory, and the first positions are available immediately. Multichannel files
+        are mixed down to mono, and the last block is zero-padded, as when chunking an Audio object.
+
+        The audio is read from the files, so any processing of the Audio objects in memory (trimming, resampling,
+        filtering) is not applied. If all microphones have a recording start time, each file is read from the
+        latest start time on and up to the earliest end time, as with SampleTrimmer.sync_environment(). Otherwise,
+        the files must already be synchronized.
+
+        Args:
+            filepaths (list[str] | None): The audio file of each microphone, in the order of the microphones.
+                Defaults to the file paths of the audio objects associated with the microphones, which must have
+                been loaded from a file.
+            chunk_duration (timedelta): The duration of each block. Defaults to 1000 ms.
+            algorithm (str): The algorithm to use for computing the TDoA values.
+            threshold (float): The threshold for the audio signal.
+            debug (bool): Print debug information if True.
+            solver (str): The multilateration solver backend, see multilaterate_by_tdoa_pairs(). Defaults to "least_squares".
+
+        Yields:
+            tuple[int, tuple[float, float] | None]: The sample index at which the block starts, and the estimated
+                (x, y) coordinates of the sound source in this block, or None if no TDoA could be computed.
+        """
+        if len(self.__mics) < 2:
+            raise ValueError("At least two microphones are needed to localize.")
 
-            if algorithm == "gcc_phat":
-                tdoa_pairs_of_chunk = get_all_tdoa_of_chunk_index_by_gcc_phat(
-                    environment=self, chunk_index=i, threshold=threshold, debug=debug
+        if filepaths is None:
+            filepaths = []
+            for mic in self.__mics:
+                if mic.get_audio() is None or mic.get_audio().get_filepath() is None:
+                    raise ValueError(
+                        f"MIC {mic.get_name()} has no audio file. Provide the filepaths explicitly."
+                    )
+                filepaths.append(mic.get_audio().get_filepath())
+
+        if len(filepaths) != len(self.__mics):
+            raise ValueError("Exactly one audio file per microphone is required.")
+
+        start_times = [mic.get_recording_start_time() for mic in self.__mics]
+
+        max_tau = self.get_max_tau()
+
+        with ExitStack() as stack:
+            files = [stack.enter_context(sf.SoundFile(path)) for path in filepaths]
+
+            sample_rates = {file.samplerate for file in files}
+            if len(sample_rates) > 1:
+                raise ValueError(
+                    "Different sample rates for microphones in the environment."
                 )
-            elif algorithm == "threshold":
-                tdoa_pairs_of_chunk = get_all_tdoa_of_chunk_index_by_threshold(
-                    environment=self, chunk_index=i, threshold=threshold, debug=debug
+            sample_rate = sample_rates.pop()
+            block_size = int(sample_rate * chunk_duration.total_seconds())
+
+            # Skip the beginning of recordings that started before the latest start time
+            offsets = [0] * len(files)
+            if all(start_time is not None for start_time in start_times):
+                latest_start = max(start_times)
+                offsets = [
+                    round((latest_start - start_time).total_seconds() * sample_rate)
+                    for start_time in start_times
+                ]
+            for file, offset in zip(files, offsets):
+                file.seek(min(offset, file.frames))
+            num_samples = min(
+                file.frames - offset for file, offset in zip(files, offsets)
+            )
+
+            signals = np.zeros((len(files), block_size), dtype=config.DTYPE)
+            sample_index = 0
+            while True:
+                signals.fill(0)
+                num_frames = []
+                for row, file in zip(signals, files):
+                    block = file.read(
+                        frames=max(min(block_size, num_samples - sample_index), 0),
+                        always_2d=True,
+                        dtype=np.dtype(config.DTYPE).name,
+                    )
+                    row[: len(block)] = np.mean(block, axis=1)
+                    num_frames.append(len(block))
+
+                if min(num_frames) == 0:
+                    return
+
+                if algorithm == "srp_phat":
+                    position = self.__localize_by_srp_phat(
+                        signals=signals[np.newaxis],
+                        sample_rate=sample_rate,
+                        threshold=threshold,
+                        debug=debug,
+                    )[0]
+                else:
+                    tdoa_pairs = self.__compute_tdoa_pairs(
+                        signals=signals,
+                        sample_rate=sample_rate,
+                        max_tau=max_tau,
+                        algorithm=algorithm,
+                        threshold=threshold,
+                        debug=debug,
+                    )
+                    position = self.__multilaterate(
+                        tdoa_pairs_of_chunks=[tdoa_pairs], solver=solver
+                    )[0]
+                yield sample_index, position
+
+                if min(num_frames) < block_size:
+                    return
+                sample_index += block_size
+
+    def __compute_tdoa_pairs(
+        self,
+        signals: np.ndarray,
+        sample_rate: int,
+        max_tau: float,
+        algorithm: str = "threshold",
+        threshold: float | None = 0.5,
+        debug: bool | None = False,
+    ) -> list[TdoaPair] | None:
+        """
+        Computes the TDoA of all microphone pairs in a single block of the stacked microphone signals.
+
+        Args:
+            signals (np.ndarray): The audio signals of the microphones as a 2-D array of shape (n_mics, n_samples).
+            sample_rate (int): The sample rate of the audio signals in Hz.
+            max_tau (float): Maximum allowable time delay in seconds between any two microphones.
+            algorithm (str): The algorithm to use for computing the TDoA values.
+            threshold (float): The threshold for the audio signal.
+            debug (bool): Print debug information if True.
+
+        Returns:
+            list[TdoaPair] | None: The TDoA of each microphone pair, or None if no TDoA could be computed.
+        """
+        if algorithm == "gcc_phat":
+            return get_all_tdoa_of_signals_by_gcc_phat(
+                mics=self.__mics,
+                signals=signals,
+                sample_rate=sample_rate,
+                max_tau=max_tau,
+                threshold=threshold,
+                debug=debug,
+            )
+        elif algorithm == "threshold":
+            return get_all_tdoa_of_signals_by_threshold(
+                mics=self.__mics,
+                signals=signals,
+                sample_rate=sample_rate,
+                threshold=threshold,
+                debug=debug,
+            )
+
+        return None
+
+    def __localize_by_srp_phat(
+        self,
+        signals: np.ndarray,
+        sample_rate: int,
+        threshold: float | None = 0.5,
+        debug: bool | None = False,
+        batch_size: int = 16,
+        refinement_levels: int = 2,
+        refinement_factor: int = 5,
+    ) -> list[tuple[float, float] | None]:
+        """
+        Localizes the sound source of each chunk as the point with the highest steered response power.
+
+        The power is first evaluated over the coarse grid of get_srp_phat_steering(), whose steering is band-limited
+        such that the response peak is wider than the grid spacing and cannot fall between two grid points. Each
+        peak is then refined on successively finer local grids around it, with a correspondingly wider frequency band.
+
+        Args:
+            signals (np.ndarray): The audio signals of the chunks as a 3-D array of shape (n_chunks, n_mics, n_samples).
+            sample_rate (int): The sample rate of the audio signals in Hz.
+            threshold (float): The threshold for the audio signal.
+            debug (bool): Print debug information if True.
+            batch_size (int): Number of chunks evaluated per matrix product, to bound memory usage. Defaults to 16.
+            refinement_levels (int): Number of coarse-to-fine refinement steps. Defaults to 2.
+            refinement_factor (int): Factor by which the grid spacing shrinks in each refinement step. Defaults to 5.
+
+        Returns:
+            list[tuple[float, float] | None]: The estimated (x, y) coordinates for each chunk, or None if any
+                of its audio signals does not contain a dominant signal.
+        """
+        n_fft = 1024
+        grid, steering = self.get_srp_phat_steering(
+            sample_rate=sample_rate, n_fft=n_fft
+        )
+        points = grid.get_points()
+
+        # If any of the audio signals does not contain a dominant signal, don't localize the chunk
+        active = np.all(np.max(np.abs(signals), axis=2) >= threshold, axis=1)
+        if debug:
+            for i in np.flatnonzero(~active):
+                print(f"Chunk {i} does not contain a dominant signal for all mics.")
+
+        offsets = np.arange(-refinement_factor, refinement_factor + 1)
+        offsets = np.stack(np.meshgrid(offsets, offsets), axis=-1).reshape(-1, 2)
+
+        positions: list[tuple[float, float] | None] = [None] * len(signals)
+        rows = np.flatnonzero(active)
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            cross = cross_spectra(signals=signals[batch], n_fft=n_fft)
+            power = steered_power(cross=cross, steering=steering)
+            for j, (i, best) in enumerate(zip(batch, np.argmax(power, axis=1))):
+                position = points[best]
+
+                # Coarse-to-fine refinement on local grids around the peak
+                step = grid.get_resolution()
+                for _ in range(refinement_levels):
+                    step /= refinement_factor
+                    candidates = position + offsets * step
+                    candidates = candidates[grid.contains(candidates)]
+                    local_steering = compute_steering_matrix(
+                        arrival_times=grid.compute_arrival_times(candidates),
+                        sample_rate=sample_rate,
+                        n_fft=n_fft,
+                        max_frequency=self.__sound_speed / (4 * step),
+                    )
+                    local_power = steered_power(
+                        cross=cross[j : j + 1], steering=local_steering
+                    )
+                    position = candidates[np.argmax(local_power[0])]
+
+                positions[i] = (float(position[0]), float(position[1]))
+                if debug:
+                    print(f"SRP-PHAT peak of chunk {i} at {positions[i]}")
+
+        return positions
+
+    def __multilaterate(
+        self,
+        tdoa_pairs_of_chunks: list[list[TdoaPair] | None],
+        solver: str = "least_squares",
+    ) -> list[tuple[float, float] | None]:
+        """
+        Multilaterates the sound source position of each chunk from its TDoA pairs.
+
+        The "closed_form" and "gauss_newton" solvers handle all chunks in one vectorized call
+        of multilaterate_batch(), and the "grid" solver matches all chunks against the TDoA grid
+        of the environment. The other solvers run multilaterate_by_tdoa_pairs() per chunk.
+
+        Args:
+            tdoa_pairs_of_chunks (list[list[TdoaPair] | None]): The TDoA pairs of each chunk, or None if a chunk has no TDoA.
+            solver (str): The multilateration solver backend, see multilaterate_by_tdoa_pairs(). Defaults to "least_squares".
+
+        Returns:
+            list[tuple[float, float] | None]: The estimated (x, y) coordinates for each chunk, or None if the chunk has no TDoA.
+        """
+        if solver not in ("closed_form", "gauss_newton", "grid"):
+            return [
+                (
+                    None
+                    if tdoa_pairs is None
+                    else multilaterate_by_tdoa_pairs(
+                        tdoa_pairs=tdoa_pairs,
+                        speed_of_sound=self.__sound_speed,
+                        solver=solver,
+                    )
                 )
+                for tdoa_pairs in tdoa_pairs_of_chunks
+            ]
 
-            if tdoa_pairs_of_chunk is None:
-                dict[f"{i * chunk_size}"] = None
-                continue
+        # The TDoA functions return the pairs in the order of combinations(mics, 2)
+        pair_indices = np.array(list(combinations(range(len(self.__mics)), 2)))
+        tdoa_matrix = np.full((len(tdoa_pairs_of_chunks), len(pair_indices)), np.nan)
+        for row, tdoa_pairs in zip(tdoa_matrix, tdoa_pairs_of_chunks):
+            if tdoa_pairs is not None:
+                row[:] = [tdoa_pair.get_tdoa() for tdoa_pair in tdoa_pairs]
 
-            sound_source_position = multilaterate_by_tdoa_pairs(
-                tdoa_pairs=tdoa_pairs_of_chunk
+        if solver == "grid":
+            positions = self.get_tdoa_grid().locate(tdoa_matrix=tdoa_matrix)
+        else:
+            positions = multilaterate_batch(
+                tdoa_matrix=tdoa_matrix,
+                mic_positions=np.array([mic.get_position() for mic in self.__mics]),
+                pair_indices=pair_indices,
+                speed_of_sound=self.__sound_speed,
+                solver=solver,
             )
 
-            dict[f"{i * chunk_size}"] = sound_source_position
+        return [
+            None if tdoa_pairs is None else tuple(position)
+            for tdoa_pairs, position in zip(tdoa_pairs_of_chunks, positions)
+        ]
 
-        return dict
+    def get_tdoa_grid(self, resolution: float | None = None) -> TdoaGrid:
+        """
+        Get the precomputed TDoA grid of the environment, used by the "grid" solver.
+
+        The grid is built on first use and cached. It is rebuilt only if the resolution, the vertices,
+        the microphone positions or the sound speed changed since it was built.
+
+        Args:
+            resolution (float | None): The distance between neighbouring grid points in meters. Defaults to the
+                resolution of the cached grid, or to 1/200 of the largest extent of the environment.
+
+        Returns:
+            TdoaGrid: The TDoA grid of the environment.
+        """
+        if len(self.__mics) < 2:
+            raise ValueError(
+                "At least two microphones are required to build a TDoA grid."
+            )
+
+        if resolution is None:
+            if self.__tdoa_grid is not None:
+                resolution = self.__tdoa_grid.get_resolution()
+            else:
+                resolution = (
+                    float(np.max(np.ptp(np.array(self.__vertices), axis=0))) / 200
+                )
+
+        mic_positions = [mic.get_position() for mic in self.__mics]
+        if (
+            self.__tdoa_grid is None
+            or self.__tdoa_grid.get_resolution() != resolution
+            or not self.__tdoa_grid.matches(
+                vertices=self.__vertices,
+                mic_positions=mic_positions,
+                sound_speed=self.__sound_speed,
+            )
+        ):
+            self.__tdoa_grid = TdoaGrid(
+                vertices=self.__vertices,
+                mic_positions=mic_positions,
+                sound_speed=self.__sound_speed,
+                resolution=resolution,
+            )
+
+        return self.__tdoa_grid
+
+    def get_srp_phat_steering(
+        self,
+        sample_rate: int,
+        n_fft: int = 1024,
+        resolution: float | None = None,
+    ) -> tuple[TdoaGrid, np.ndarray]:
+        """
+        Get the coarse candidate grid and the cached steering matrix used by the "srp_phat" algorithm.
+
+        The steering matrix is computed once per microphone from the arrival times at the grid points, and
+        recomputed only if the grid, the sample rate or the FFT length changed. It only covers the frequencies up to
+        c / (4 * resolution), whose response peak is wide enough to be sampled by the grid; the full band is used
+        when the peak is refined around the best grid point.
+
+        Args:
+            sample_rate (int): The sample rate of the audio signals in Hz.
+            n_fft (int): The FFT length of the analysis frames. Defaults to 1024.
+            resolution (float | None): The distance between neighbouring grid points in meters. Defaults to the
+                resolution of the cached grid, or to 1/50 of the largest extent of the environment.
+
+        Returns:
+            tuple[TdoaGrid, np.ndarray]: The grid of candidate points and its steering matrix.
+        """
+        if len(self.__mics) < 2:
+            raise ValueError("At least two microphones are required for SRP-PHAT.")
+
+        if resolution is None:
+            if self.__srp_phat_grid is not None:
+                resolution = self.__srp_phat_grid.get_resolution()
+            else:
+                resolution = (
+                    float(np.max(np.ptp(np.array(self.__vertices), axis=0))) / 50
+                )
+
+        mic_positions = [mic.get_position() for mic in self.__mics]
+        if (
+            self.__srp_phat_grid is None
+            or self.__srp_phat_grid.get_resolution() != resolution
+            or not self.__srp_phat_grid.matches(
+                vertices=self.__vertices,
+                mic_positions=mic_positions,
+                sound_speed=self.__sound_speed,
+            )
+        ):
+            self.__srp_phat_grid = TdoaGrid(
+                vertices=self.__vertices,
+                mic_positions=mic_positions,
+                sound_speed=self.__sound_speed,
+                resolution=resolution,
+            )
+            self.__srp_phat_steering = None
+
+        if self.__srp_phat_steering is None or self.__srp_phat_steering[0] != (
+            sample_rate,
+            n_fft,
+        ):
+            self.__srp_phat_steering = (
+                (sample_rate, n_fft),
+                compute_steering_matrix(
+                    arrival_times=self.__srp_phat_grid.compute_arrival_times(
+                        self.__srp_phat_grid.get_points()
+                    ),
+                    sample_rate=sample_rate,
+                    n_fft=n_fft,
+                    max_frequency=self.__sound_speed / (4 * resolution),
+                ),
+            )
+
+        return self.__srp_phat_grid, self.__srp_phat_steering[1]
 
     def visualize(self) -> None:
         """
@@ -328,3 +1071,71 @@ class Environment:
             sound_source_position (tuple[float, float]): The (x, y) coordinates of the measured sound source.
         """
         self.__sound_source_position = sound_source_position
+
+
+def _get_root_array(array: np.ndarray) -> np.ndarray:
+    """
+    Get the array that owns the memory of a (possibly nested) view.
+
+    Args:
+        array (np.ndarray): The array or view.
+
+    Returns:
+        np.ndarray: The array owning the memory.
+    """
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+# Environment of a localization worker process, set once per process by the pool initializer
+_worker_environment: Environment | None = None
+
+
+def _init_localize_worker(environment: Environment) -> None:
+    """
+    Initialize a localization worker process with the environment to localize.
+
+    Args:
+        environment (Environment): The environment shared by all tasks of the worker.
+    """
+    global _worker_environment
+    _worker_environment = environment
+
+
+def _localize_chunks_in_worker(
+    chunk_indices: list[int],
+    algorithm: str,
+    threshold: float | None,
+    debug: bool | None,
+    solver: str,
+    frame_samples: int | None = None,
+    hop_samples: int | None = None,
+    window: np.ndarray | None = None,
+) -> list[tuple[float, float] | None]:
+    """
+    Localize a batch of chunks in a worker process.
+
+    Args:
+        chunk_indices (list[int]): The indices of the chunks (or frames) to localize.
+        algorithm (str): The algorithm to use for computing the TDoA values.
+        threshold (float): The threshold for the audio signal.
+        debug (bool): Print debug information if True.
+        solver (str): The multilateration solver backend, see multilaterate_by_tdoa_pairs().
+        frame_samples (int | None): The number of samples per frame. If None, the chunks of the audio signals are localized.
+        hop_samples (int | None): The number of samples between the starts of consecutive frames.
+        window (np.ndarray | None): Window function applied to each frame. Defaults to None.
+
+    Returns:
+        list[tuple[float, float] | None]: The estimated (x, y) coordinates for each chunk.
+    """
+    return _worker_environment._localize_chunks(
+        chunk_indices=chunk_indices,
+        algorithm=algorithm,
+        threshold=threshold,
+        debug=debug,
+        solver=solver,
+        frame_samples=frame_samples,
+        hop_samples=hop_samples,
+        window=window,
+    )
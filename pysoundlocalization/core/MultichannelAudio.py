@@ -0,0 +1,120 @@
+import numpy as np
+import os
+import soundfile as sf
+from pysoundlocalization.core.Audio import Audio
+import pysoundlocalization.config as config
+
+
+class MultichannelAudio:
+    def __init__(
+        self,
+        filepath: str | None = None,
+        audio_signals: np.ndarray | None = None,
+        sample_rate: int | None = None,
+    ):
+        """
+        Initialize a multichannel audio, e.g. the recording of a multichannel field recorder in a single interleaved file.
+
+        The samples are kept as one contiguous array of shape (n_channels, n_samples), which is a copy of the given
+        audio signals. Each channel is exposed as an Audio object whose audio signal is a view of its row, so that
+        no channel is copied. This sharing is deliberate: in-place changes of a chunk of a channel are written to
+        the multichannel audio signals.
+
+        Args:
+            filepath (str | None): Path to the multichannel audio file.
+            audio_signals (np.ndarray | None): The audio signals as a 2-D array of shape (n_channels, n_samples).
+            sample_rate (int | None): The sample rate in Hz.
+        """
+        self.__filepath = filepath
+        self.__sample_rate = sample_rate
+
+        if audio_signals is None:
+            if not filepath or not os.path.exists(filepath):
+                raise FileNotFoundError(
+                    f"No valid audio file provided or file not found: {filepath}"
+                )
+            audio_signals, self.__sample_rate = sf.read(
+                filepath, always_2d=True, dtype=np.dtype(config.DTYPE).name
+            )
+            audio_signals = audio_signals.T
+
+        if audio_signals.ndim != 2:
+            raise ValueError(
+                "Audio signals must be a 2-D array of shape (n_channels, n_samples)."
+            )
+
+        self.__audio_signals = np.array(audio_signals, dtype=config.DTYPE, order="C")
+        self.__channels = [
+            Audio(audio_signal=signal, sample_rate=self.__sample_rate, copy=False)
+            for signal in self.__audio_signals
+        ]
+
+        print(
+            f"Multichannel audio with {self.get_num_channels()} channels created from {filepath}"
+        )
+
+    def get_channel(self, index: int) -> Audio:
+        """
+        Get the audio of a single channel. Its audio signal is a view of the multichannel audio signals until it is replaced.
+
+        Args:
+            index (int): The index of the channel.
+
+        Returns:
+            Audio: The audio of the channel.
+        """
+        return self.__channels[index]
+
+    def get_channels(self) -> list[Audio]:
+        """
+        Get the audio of all channels.
+
+        Returns:
+            list[Audio]: The audio of each channel.
+        """
+        return self.__channels
+
+    def get_audio_signals(self) -> np.ndarray:
+        """
+        Get the audio signals of all channels.
+
+        Returns:
+            np.ndarray: The audio signals as a 2-D array of shape (n_channels, n_samples).
+        """
+        return self.__audio_signals
+
+    def get_num_channels(self) -> int:
+        """
+        Get the number of channels.
+
+        Returns:
+            int: The number of channels.
+        """
+        return self.__audio_signals.shape[0]
+
+    def get_num_samples(self) -> int:
+        """
+        Get the number of samples per channel.
+
+        Returns:
+            int: The number of samples per channel.
+        """
+        return self.__audio_signals.shape[1]
+
+    def get_sample_rate(self) -> int:
+        """
+        Get the sample rate of the multichannel audio.
+
+        Returns:
+            int: The sample rate in Hz.
+        """
+        return self.__sample_rate
+
+    def get_filepath(self) -> str | None:
+        """
+        Get the file path of the multichannel audio file.
+
+        Returns:
+            str | None: The file path of the multichannel audio file, or None if it was created from audio signals.
+        """
+        return self.__filepath
@@ -0,0 +1,231 @@
+from itertools import combinations
+import numpy as np
+
+
+class TdoaGrid:
+    def __init__(
+        self,
+        vertices: list[tuple[float, float]],
+        mic_positions: list[tuple[float, float]],
+        sound_speed: float,
+        resolution: float,
+    ) -> None:
+        """
+        Precompute the theoretical TDoA vector of every grid point inside the environment polygon.
+
+        The TDoA of each grid point is stored for all microphone pairs in the order of
+        itertools.combinations(mics, 2), as a compact float32 array of shape (n_points, n_pairs).
+
+        Args:
+            vertices (list[tuple[float, float]]): List of (x, y) coordinates defining the environment's shape.
+            mic_positions (list[tuple[float, float]]): The (x, y) positions of the microphones.
+            sound_speed (float): The speed of sound in m/s.
+            resolution (float): The distance between neighbouring grid points in meters.
+        """
+        if resolution <= 0:
+            raise ValueError("The grid resolution must be positive.")
+
+        self.__vertices = np.array(vertices, dtype=float)
+        self.__mic_positions = np.array(mic_positions, dtype=float)
+        self.__sound_speed = sound_speed
+        self.__resolution = resolution
+        self.__pair_indices = np.array(
+            list(combinations(range(len(mic_positions)), 2))
+        ).reshape(-1, 2)
+
+        # Grid points covering the bounding box of the polygon, restricted to the polygon
+        x_min, y_min = np.min(self.__vertices, axis=0)
+        x_max, y_max = np.max(self.__vertices, axis=0)
+        xs = np.arange(x_min, x_max + resolution / 2, resolution)
+        ys = np.arange(y_min, y_max + resolution / 2, resolution)
+        points = np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 2)
+        self.__points = points[self.contains(points)]
+
+        self.__tdoas = self.compute_tdoas(self.__points).astype(np.float32)
+        self.__squared_norms = np.sum(
+            self.__tdoas.astype(float) ** 2, axis=1, dtype=float
+        )
+
+        print(
+            f"TDoA grid with {len(self.__points)} points at {resolution} m resolution created."
+        )
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """
+        Check which points are inside the environment polygon (vectorized ray-casting algorithm).
+
+        Args:
+            points (np.ndarray): The (x, y) coordinates of the points, of shape (..., 2).
+
+        Returns:
+            np.ndarray: Boolean array of shape (...), True for points inside the polygon.
+        """
+        x, y = points[..., 0], points[..., 1]
+        inside = np.zeros(x.shape, dtype=bool)
+
+        # Iterate over each edge of the polygon
+        for (x1, y1), (x2, y2) in zip(
+            self.__vertices, np.roll(self.__vertices, -1, axis=0)
+        ):
+            if y1 == y2:
+                continue
+            crosses = ((y1 > y) != (y2 > y)) & (
+                x < (x2 - x1) * (y - y1) / (y2 - y1) + x1
+            )
+            inside ^= crosses
+
+        return inside
+
+    def compute_arrival_times(self, points: np.ndarray) -> np.ndarray:
+        """
+        Compute the propagation time from sound sources at the given points to every microphone.
+
+        Args:
+            points (np.ndarray): The (x, y) coordinates of the sound sources, of shape (..., 2).
+
+        Returns:
+            np.ndarray: The propagation time in seconds to each microphone, of shape (..., n_mics).
+        """
+        distances = np.linalg.norm(
+            points[..., np.newaxis, :] - self.__mic_positions, axis=-1
+        )
+        return distances / self.__sound_speed
+
+    def compute_tdoas(self, points: np.ndarray) -> np.ndarray:
+        """
+        Compute the theoretical TDoA of all microphone pairs for sound sources at the given points.
+
+        Args:
+            points (np.ndarray): The (x, y) coordinates of the sound sources, of shape (..., 2).
+
+        Returns:
+            np.ndarray: The TDoA in seconds (distance to mic1 minus distance to mic2), of shape (..., n_pairs).
+        """
+        arrival_times = self.compute_arrival_times(points)
+        return (
+            arrival_times[..., self.__pair_indices[:, 0]]
+            - arrival_times[..., self.__pair_indices[:, 1]]
+        )
+
+    def locate(
+        self,
+        tdoa_matrix: np.ndarray,
+        weights: np.ndarray | None = None,
+        refinement_levels: int = 2,
+        refinement_factor: int = 5,
+        batch_size: int = 256,
+    ) -> np.ndarray:
+        """
+        Locate the sound source of each chunk by matching its measured TDoAs against the grid.
+
+        The nearest grid point of all chunks of a batch is found with a single matrix product. Optionally,
+        each estimate is then refined on successively finer local grids around it.
+
+        Args:
+            tdoa_matrix (np.ndarray): The measured TDoA values in seconds, of shape (n_chunks, n_pairs). Chunks containing NaN are skipped.
+            weights (np.ndarray | None): Optional non-negative weight of each pair in the matching, of shape (n_pairs,).
+            refinement_levels (int): Number of coarse-to-fine refinement steps. Defaults to 2.
+            refinement_factor (int): Factor by which the grid spacing shrinks in each refinement step. Defaults to 5.
+            batch_size (int): Number of chunks matched per matrix product, to bound memory usage. Defaults to 256.
+
+        Returns:
+            np.ndarray: The estimated (x, y) coordinates of each chunk, of shape (n_chunks, 2). Skipped chunks are NaN.
+        """
+        tdoa_matrix = np.asarray(tdoa_matrix, dtype=float)
+        if tdoa_matrix.shape[1] != len(self.__pair_indices):
+            raise ValueError(
+                f"Expected {len(self.__pair_indices)} TDoA values per chunk, got {tdoa_matrix.shape[1]}."
+            )
+
+        if weights is None:
+            weights = np.ones(tdoa_matrix.shape[1])
+        sqrt_weights = np.sqrt(np.asarray(weights, dtype=float))
+
+        grid_tdoas = self.__tdoas
+        squared_norms = self.__squared_norms
+        if not np.all(sqrt_weights == 1):
+            grid_tdoas = (grid_tdoas * sqrt_weights).astype(np.float32)
+            squared_norms = np.sum(grid_tdoas.astype(float) ** 2, axis=1)
+
+        positions = np.full((tdoa_matrix.shape[0], 2), np.nan)
+        valid = np.flatnonzero(np.all(np.isfinite(tdoa_matrix), axis=1))
+        if len(self.__points) == 0:
+            return positions
+
+        # |g - m|^2 = |g|^2 - 2 g.m + |m|^2, where |m|^2 is irrelevant for the nearest neighbour
+        for start in range(0, len(valid), batch_size):
+            rows = valid[start : start + batch_size]
+            measured = (tdoa_matrix[rows] * sqrt_weights).astype(np.float32)
+            distances = squared_norms[:, np.newaxis] - 2 * (grid_tdoas @ measured.T)
+            positions[rows] = self.__points[np.argmin(distances, axis=0)]
+
+        # Coarse-to-fine refinement on local grids around each estimate
+        step = self.__resolution
+        offsets = np.arange(-refinement_factor, refinement_factor + 1)
+        for _ in range(refinement_levels):
+            step /= refinement_factor
+            local = (
+                np.stack(np.meshgrid(offsets, offsets), axis=-1).reshape(-1, 2) * step
+            )
+            candidates = positions[valid, np.newaxis, :] + local
+            residuals = (
+                self.compute_tdoas(candidates) - tdoa_matrix[valid, np.newaxis, :]
+            ) * sqrt_weights
+            costs = np.sum(residuals**2, axis=-1)
+            costs[~self.contains(candidates)] = np.inf
+            best = np.argmin(costs, axis=1)
+            positions[valid] = candidates[np.arange(len(valid)), best]
+
+        return positions
+
+    def get_points(self) -> np.ndarray:
+        """
+        Get the grid points inside the environment.
+
+        Returns:
+            np.ndarray: The (x, y) coordinates of the grid points, of shape (n_points, 2).
+        """
+        return self.__points
+
+    def get_tdoas(self) -> np.ndarray:
+        """
+        Get the precomputed TDoA vectors of the grid points.
+
+        Returns:
+            np.ndarray: The TDoA in seconds of every grid point and microphone pair, of shape (n_points, n_pairs).
+        """
+        return self.__tdoas
+
+    def get_resolution(self) -> float:
+        """
+        Get the distance between neighbouring grid points.
+
+        Returns:
+            float: The grid resolution in meters.
+        """
+        return self.__resolution
+
+    def matches(
+        self,
+        vertices: list[tuple[float, float]],
+        mic_positions: list[tuple[float, float]],
+        sound_speed: float,
+    ) -> bool:
+        """
+        Check whether the grid was built for the given environment geometry.
+
+        Args:
+            vertices (list[tuple[float, float]]): List of (x, y) coordinates defining the environment's shape.
+            mic_positions (list[tuple[float, float]]): The (x, y) positions of the microphones.
+            sound_speed (float): The speed of sound in m/s.
+
+        Returns:
+            bool: True if the grid is valid for the given geometry.
+        """
+        return (
+            sound_speed == self.__sound_speed
+            and np.array_equal(np.array(vertices, dtype=float), self.__vertices)
+            and np.array_equal(
+                np.array(mic_positions, dtype=float), self.__mic_positions
+            )
+        )
@@ -9,6 +9,8 @@ Adapted as part of a project for sound localization.
 """
 
 import numpy as np
+from itertools import combinations
+import pysoundlocalization.config as config
 
 
 def gcc_phat(
@@ -17,6 +19,7 @@ def gcc_phat(
     fs: int = 1,
     max_tau: float | None = None,
     interp: int = 16,
+    refinement: str | None = None,
 ) -> tuple[float, np.ndarray]:
     """
     Computes the time delay estimation (tau) between a signal `sig` and a reference signal `refsig`
@@ -28,12 +31,20 @@ def gcc_phat(
         fs (int): The sampling rate of the signals in Hz. Defaults to 1.
         max_tau (float | None): Maximum allowable time delay in seconds. Limits the search window. Defaults to None.
         interp (int): Interpolation factor to improve precision. Defaults to 16.
+        refinement (str | None): Sub-sample peak estimation mode. If None, the whole cross-correlation is
+            oversampled by `interp` with a single inverse FFT. If "sinc", a full-resolution inverse FFT locates
+            the peak, and the band-limited cross-correlation is only evaluated on the `interp` grid around it,
+            which yields the same tau at a fraction of the cost. If "parabolic", the peak is refined by fitting
+            a parabola through the peak sample and its two neighbours. Defaults to None.
 
     Returns:
         tuple[float, np.ndarray]: A tuple containing:
             - tau (float): The estimated time delay between the signals in seconds.
             - cc (np.ndarray): The cross-correlation result array.
     """
+    sig = np.asarray(sig, dtype=config.DTYPE)
+    refsig = np.asarray(refsig, dtype=config.DTYPE)
+
     # make sure the length for the FFT is larger or equal than len(sig) + len(refsig)
     n = sig.shape[0] + refsig.shape[0]
 
@@ -42,23 +53,153 @@ def gcc_phat(
     REFSIG = np.fft.rfft(refsig, n=n)
     R = SIG * np.conj(REFSIG)
 
-    cc = np.fft.irfft(R / np.abs(R), n=(interp * n))
+    taus, ccs = _estimate_taus(
+        R=(R / np.abs(R))[np.newaxis, :],
+        n=n,
+        fs=fs,
+        max_tau=max_tau,
+        interp=interp,
+        refinement=refinement,
+    )
 
-    max_shift = int(interp * n / 2)
-    if max_tau:
-        max_shift = np.minimum(int(interp * fs * max_tau), max_shift)
+    return taus[0], ccs[0]
+
+
+def gcc_phat_all_pairs(
+    signals: np.ndarray,
+    fs: int = 1,
+    max_tau: float | None = None,
+    interp: int = 16,
+    refinement: str | None = None,
+) -> tuple[list[tuple[int, int]], np.ndarray]:
+    """
+    Computes the GCC-PHAT time delay estimation for every pair of rows in `signals`.
+
+    Each signal is transformed exactly once (a single 2-D rfft over all rows), and the pairwise
+    cross-spectra are formed from these cached spectra. For a pair (i, j), the result is identical
+    to gcc_phat(sig=signals[i], refsig=signals[j], ...).
+
+    Args:
+        signals (np.ndarray): The input signals as a 2-D array of shape (n_signals, n_samples).
+        fs (int): The sampling rate of the signals in Hz. Defaults to 1.
+        max_tau (float | None): Maximum allowable time delay in seconds. Limits the search window. Defaults to None.
+        interp (int): Interpolation factor to improve precision. Defaults to 16.
+        refinement (str | None): Sub-sample peak estimation mode, see gcc_phat(). Defaults to None.
 
-    cc = np.concatenate((cc[-max_shift:], cc[: max_shift + 1]))
+    Returns:
+        tuple[list[tuple[int, int]], np.ndarray]: A tuple containing:
+            - pairs (list[tuple[int, int]]): The (i, j) row indices of each pair, in the order of itertools.combinations.
+            - taus (np.ndarray): The estimated time delay in seconds of each pair.
+    """
+    if signals.ndim != 2:
+        raise ValueError("Signals must be a 2-D array of shape (n_signals, n_samples).")
+
+    signals = np.asarray(signals, dtype=config.DTYPE)
+
+    # make sure the length for the FFT is larger or equal than len(sig) + len(refsig)
+    n = 2 * signals.shape[1]
+
+    # Transform every signal once and form all cross-spectra from the cached spectra
+    SIGS = np.fft.rfft(signals, n=n, axis=-1)
+    pairs = list(combinations(range(signals.shape[0]), 2))
+    first, second = np.array(pairs, dtype=int).reshape(-1, 2).T
+    R = SIGS[first] * np.conj(SIGS[second])
+    R /= np.abs(R)
+
+    taus, _ = _estimate_taus(
+        R=R, n=n, fs=fs, max_tau=max_tau, interp=interp, refinement=refinement
+    )
+
+    return pairs, taus
+
+
+def _estimate_taus(
+    R: np.ndarray,
+    n: int,
+    fs: int,
+    max_tau: float | None,
+    interp: int,
+    refinement: str | None,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """
+    Locates the cross-correlation peak of each row of PHAT-weighted cross-spectra.
 
-    # find max cross correlation index
-    shift = np.argmax(cc) - max_shift
+    Args:
+        R (np.ndarray): PHAT-weighted cross-spectra of shape (n_pairs, n // 2 + 1).
+        n (int): The FFT length the cross-spectra were computed with.
+        fs (int): The sampling rate of the signals in Hz.
+        max_tau (float | None): Maximum allowable time delay in seconds.
+        interp (int): Interpolation factor to improve precision.
+        refinement (str | None): Sub-sample peak estimation mode, see gcc_phat().
 
-    # Sometimes, there is a 180-degree phase difference between the two microphones.
-    # shift = np.argmax(np.abs(cc)) - max_shift
+    Returns:
+        tuple[np.ndarray, list[np.ndarray]]: The estimated time delays in seconds and the cross-correlation of each row.
+    """
+    if refinement not in (None, "sinc", "parabolic"):
+        raise ValueError(
+            f"Unknown refinement '{refinement}'. Use None, 'sinc' or 'parabolic'."
+        )
 
-    tau = shift / float(interp * fs)
+    max_shift = int(interp * n / 2)
+    if max_tau:
+        max_shift = np.minimum(int(interp * fs * max_tau), max_shift)
 
-    return tau, cc
+    if refinement is None:
+        # The oversampled inverse transform is done row by row to bound memory usage
+        taus = np.empty(R.shape[0])
+        ccs = []
+        for k in range(R.shape[0]):
+            cc = np.fft.irfft(R[k], n=(interp * n))
+            cc = np.concatenate((cc[-max_shift:], cc[: max_shift + 1]))
+
+            # find max cross correlation index
+            shift = np.argmax(cc) - max_shift
+
+            # Sometimes, there is a 180-degree phase difference between the two microphones.
+            # shift = np.argmax(np.abs(cc)) - max_shift
+
+            taus[k] = shift / float(interp * fs)
+            ccs.append(cc)
+        return taus, ccs
+
+    # Coarse search at full resolution, restricted to the physically valid lag window
+    coarse_shift = int(min(np.ceil(max_shift / interp), n // 2))
+    cc = np.fft.irfft(R, n=n, axis=-1)
+    cc = np.concatenate((cc[:, -coarse_shift:], cc[:, : coarse_shift + 1]), axis=-1)
+    peak = np.argmax(cc, axis=-1)
+    rows = np.arange(R.shape[0])
+
+    if refinement == "parabolic":
+        left = cc[rows, np.maximum(peak - 1, 0)]
+        center = cc[rows, peak]
+        right = cc[rows, np.minimum(peak + 1, cc.shape[1] - 1)]
+        denominator = left - 2 * center + right
+        offset = np.zeros(R.shape[0])
+        valid = (peak > 0) & (peak < cc.shape[1] - 1) & (denominator != 0)
+        offset[valid] = 0.5 * (left[valid] - right[valid]) / denominator[valid]
+        taus = (peak - coarse_shift + offset) / float(fs)
+        return taus, list(cc)
+
+    # Evaluate the band-limited cross-correlation only on the interp grid around the coarse peak.
+    # These are exactly the values an irfft with n=(interp * n) would produce at these lags.
+    fine_offsets = np.arange(-interp, interp + 1)
+    fine_shifts = (peak - coarse_shift)[:, np.newaxis] * interp + fine_offsets
+    k = np.arange(R.shape[1])
+    weights = np.full(R.shape[1], 2.0)
+    weights[0] = 1.0
+    complex_dtype = config.get_complex_dtype()
+    spectrum = (
+        R * weights * np.exp(2j * np.pi * np.outer(fine_shifts[:, 0], k) / (interp * n))
+    ).astype(complex_dtype)
+    step = np.exp(2j * np.pi * k / (interp * n)).astype(complex_dtype)
+    fine_cc = np.empty(fine_shifts.shape, dtype=config.DTYPE)
+    for m in range(fine_shifts.shape[1]):
+        fine_cc[:, m] = np.sum(spectrum.real, axis=-1)
+        spectrum *= step
+    fine_cc[np.abs(fine_shifts) > max_shift] = -np.inf
+    shift = fine_shifts[rows, np.argmax(fine_cc, axis=-1)]
+    taus = shift / float(interp * fs)
+    return taus, list(cc)
 
 
 def main():
@@ -7,6 +7,7 @@ from scipy.optimize import least_squares
 def multilaterate_by_tdoa_pairs(
     tdoa_pairs: TdoaPair,
     speed_of_sound: float = config.DEFAULT_SOUND_SPEED,
+    solver: str = "least_squares",
 ) -> tuple[float, float]:
     """
     Approximates the sound source position given all microphone pairs and their computed TDoA values.
@@ -14,6 +15,11 @@ def multilaterate_by_tdoa_pairs(
     Args:
         tdoa_pairs (list[TdoaPair]): A list of TdoaPair objects representing the TDoA values between microphone pairs.
         speed_of_sound (float): Optional speed of sound in meters per second. Defaults to the value set in config.DEFAULT_SOUND_SPEED.
+        solver (str): The solver backend to use. "least_squares" minimizes the hyperbolic equations iteratively,
+            starting at the center of the microphones. "closed_form" solves the linearized equations directly
+            (spherical intersection, requires at least three microphones). "hybrid" uses the closed-form estimate
+            as the initial guess of the least squares refinement. "gauss_newton" refines the closed-form estimate with
+            the vectorized damped Gauss-Newton iterations of multilaterate_batch(). Defaults to "least_squares".
 
     Returns:
         tuple[float, float]: The estimated (x, y) coordinates of the sound source.
@@ -26,45 +32,386 @@ def multilaterate_by_tdoa_pairs(
             "At least two microphone pairs are required to approximate the sound source."
         )
 
-    # Convert TDOA times to distance differences in meters
-    tdoa_distances = [
-        (
-            tdoa_pair.get_mic1(),
-            tdoa_pair.get_mic2(),
-            tdoa_pair.get_tdoa() * speed_of_sound,
+    if solver not in ("least_squares", "closed_form", "hybrid", "gauss_newton"):
+        raise ValueError(
+            f"Unknown solver '{solver}'. Use 'least_squares', 'closed_form', 'hybrid' or 'gauss_newton'."
         )
-        for tdoa_pair in tdoa_pairs
-    ]
+
+    mic_positions, pair_indices, distance_differences = tdoa_pairs_to_arrays(
+        tdoa_pairs=tdoa_pairs, speed_of_sound=speed_of_sound
+    )
+
+    if solver == "gauss_newton":
+        xs, ys = multilaterate_batch(
+            tdoa_matrix=distance_differences[np.newaxis, :],
+            mic_positions=mic_positions,
+            pair_indices=pair_indices,
+            speed_of_sound=1.0,
+            solver=solver,
+        )[0]
+        return xs, ys
+
+    if solver in ("closed_form", "hybrid"):
+        closed_form_position = multilaterate_closed_form(
+            mic_positions=mic_positions,
+            pair_indices=pair_indices,
+            distance_differences=distance_differences,
+        )
+        if solver == "closed_form":
+            xs, ys = closed_form_position
+            return xs, ys
+        initial_guess = np.array(closed_form_position)
+    else:
+        # Initial guess: center of the mic pairs
+        initial_guess = np.mean(
+            (mic_positions[pair_indices[:, 0]] + mic_positions[pair_indices[:, 1]]) / 2,
+            axis=0,
+        )
+
+    xs, ys = multilaterate_least_squares(
+        mic_positions=mic_positions,
+        pair_indices=pair_indices,
+        distance_differences=distance_differences,
+        initial_guess=initial_guess,
+    )
+
+    return xs, ys
+
+
+def multilaterate_least_squares(
+    mic_positions: np.ndarray,
+    pair_indices: np.ndarray,
+    distance_differences: np.ndarray,
+    initial_guess: np.ndarray,
+) -> tuple[float, float]:
+    """
+    Estimates the sound source position by minimizing the hyperbolic TDoA equations with least squares.
+
+    The residuals are evaluated with NumPy broadcasting over all pairs, and the exact Jacobian is supplied
+    to the optimizer, so no function evaluations are spent on finite differences.
+
+    Args:
+        mic_positions (np.ndarray): The (x, y) positions of the microphones, of shape (n_mics, 2).
+        pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+        distance_differences (np.ndarray): The distance to mic1 minus the distance to mic2 of each pair in meters.
+        initial_guess (np.ndarray): The (x, y) position to start the optimization from.
+
+    Returns:
+        tuple[float, float]: The estimated (x, y) coordinates of the sound source.
+    """
+    first_positions = mic_positions[pair_indices[:, 0]]
+    second_positions = mic_positions[pair_indices[:, 1]]
 
     # Define the system of equations based on the hyperbolic equations for TDOA
-    def multilateration_fn(initial_guess):
+    def multilateration_fn(position: np.ndarray) -> np.ndarray:
         """Function to minimize for multilateration."""
-        px, py = initial_guess
-        equations = []
-        for mic1, mic2, d in tdoa_distances:
-            x1, y1 = mic1.get_position()
-            x2, y2 = mic2.get_position()
-            dist1 = np.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-            dist2 = np.sqrt((px - x2) ** 2 + (py - y2) ** 2)
-            equations.append(dist1 - dist2 - d)
-        return equations
-
-    # Initial guess (e.g., center of the mic positions or any reasonable point)
-    # Or any reasonable starting point in your coordinate system
-    initial_guess = [0, 0]
-    for mic1, mic2, d in tdoa_distances:
-        x1, y1 = mic1.get_position()
-        x2, y2 = mic2.get_position()
-        initial_guess[0] += (x1 + x2) / 2
-        initial_guess[1] += (y1 + y2) / 2
-    initial_guess[0] /= len(tdoa_distances)
-    initial_guess[1] /= len(tdoa_distances)
+        dist1 = np.linalg.norm(position - first_positions, axis=1)
+        dist2 = np.linalg.norm(position - second_positions, axis=1)
+        return dist1 - dist2 - distance_differences
+
+    def multilateration_jacobian(position: np.ndarray) -> np.ndarray:
+        """Jacobian of multilateration_fn with respect to the (x, y) position."""
+        delta1 = position - first_positions
+        delta2 = position - second_positions
+        dist1 = np.maximum(np.linalg.norm(delta1, axis=1), 1e-12)
+        dist2 = np.maximum(np.linalg.norm(delta2, axis=1), 1e-12)
+        return delta1 / dist1[:, np.newaxis] - delta2 / dist2[:, np.newaxis]
 
     # Solve using least squares optimization
-    result = least_squares(multilateration_fn, initial_guess)
+    result = least_squares(
+        multilateration_fn, initial_guess, jac=multilateration_jacobian
+    )
 
-    source_position = result.x
+    xs, ys = result.x
+
+    return xs, ys
 
-    xs, ys = source_position
+
+def tdoa_pairs_to_arrays(
+    tdoa_pairs: list[TdoaPair],
+    speed_of_sound: float = config.DEFAULT_SOUND_SPEED,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts TdoaPair objects into the array representation used by the vectorized solvers.
+
+    Args:
+        tdoa_pairs (list[TdoaPair]): A list of TdoaPair objects representing the TDoA values between microphone pairs.
+        speed_of_sound (float): Optional speed of sound in meters per second. Defaults to the value set in config.DEFAULT_SOUND_SPEED.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: A tuple containing:
+            - mic_positions (np.ndarray): The (x, y) positions of the distinct microphones, of shape (n_mics, 2).
+            - pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+            - distance_differences (np.ndarray): The TDoA of each pair converted to meters, of shape (n_pairs,).
+    """
+    mics = []
+    pair_indices = np.empty((len(tdoa_pairs), 2), dtype=int)
+    for k, tdoa_pair in enumerate(tdoa_pairs):
+        for m, mic in enumerate((tdoa_pair.get_mic1(), tdoa_pair.get_mic2())):
+            if mic not in mics:
+                mics.append(mic)
+            pair_indices[k, m] = mics.index(mic)
+
+    mic_positions = np.array([mic.get_position() for mic in mics], dtype=float)
+    distance_differences = (
+        np.array([tdoa_pair.get_tdoa() for tdoa_pair in tdoa_pairs], dtype=float)
+        * speed_of_sound
+    )
+
+    return mic_positions, pair_indices, distance_differences
+
+
+def multilaterate_closed_form(
+    mic_positions: np.ndarray,
+    pair_indices: np.ndarray,
+    distance_differences: np.ndarray,
+) -> tuple[float, float]:
+    """
+    Estimates the sound source position in closed form from the linearized TDoA equations (spherical intersection).
+
+    The distance differences of arbitrary microphone pairs are first reconciled into range differences
+    relative to a reference microphone by linear least squares. With r_0 being the unknown distance
+    between source and reference microphone, every other microphone i then contributes the linear equation
+    -2 (m_i - m_0) . p - 2 d_i r_0 = d_i^2 - |m_i|^2 + |m_0|^2. Solving for p as a function of r_0 and
+    substituting into r_0^2 = |p - m_0|^2 leaves a quadratic equation in r_0.
+
+    Args:
+        mic_positions (np.ndarray): The (x, y) positions of the microphones, of shape (n_mics, 2).
+        pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+        distance_differences (np.ndarray): The distance to mic1 minus the distance to mic2 of each pair in meters.
+
+    Returns:
+        tuple[float, float]: The estimated (x, y) coordinates of the sound source.
+
+    Raises:
+        ValueError: If fewer than three microphones are involved.
+    """
+    if mic_positions.shape[0] < 3:
+        raise ValueError(
+            "At least three microphones are required for the closed-form solution."
+        )
+
+    xs, ys = _closed_form_batch(
+        distance_differences=distance_differences[np.newaxis, :],
+        mic_positions=mic_positions,
+        pair_indices=pair_indices,
+    )[0]
 
     return xs, ys
+
+
+def multilaterate_batch(
+    tdoa_matrix: np.ndarray,
+    mic_positions: np.ndarray,
+    pair_indices: np.ndarray,
+    speed_of_sound: float = config.DEFAULT_SOUND_SPEED,
+    solver: str = "gauss_newton",
+    max_iterations: int = 50,
+) -> np.ndarray:
+    """
+    Approximates the sound source positions of many chunks at once, given their TDoA values.
+
+    All chunks share the same microphone geometry and pairs, so the closed-form solution and the
+    Gauss-Newton refinement are evaluated for the whole batch with vectorized NumPy operations.
+
+    Args:
+        tdoa_matrix (np.ndarray): The TDoA values in seconds, of shape (n_chunks, n_pairs). Chunks containing NaN are skipped.
+        mic_positions (np.ndarray): The (x, y) positions of the microphones, of shape (n_mics, 2).
+        pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+        speed_of_sound (float): Optional speed of sound in meters per second. Defaults to the value set in config.DEFAULT_SOUND_SPEED.
+        solver (str): "closed_form" returns the linearized estimate (requires at least three microphones).
+            "gauss_newton" refines it with damped Gauss-Newton iterations on the hyperbolic equations, starting at
+            the center of the microphones if fewer than three microphones are available. Defaults to "gauss_newton".
+        max_iterations (int): Maximum number of Gauss-Newton iterations. Defaults to 50.
+
+    Returns:
+        np.ndarray: The estimated (x, y) coordinates of each chunk, of shape (n_chunks, 2). Skipped chunks are NaN.
+
+    Raises:
+        ValueError: If fewer than two microphone pairs are provided.
+    """
+    if solver not in ("closed_form", "gauss_newton"):
+        raise ValueError(
+            f"Unknown batch solver '{solver}'. Use 'closed_form' or 'gauss_newton'."
+        )
+
+    mic_positions = np.asarray(mic_positions, dtype=float)
+    pair_indices = np.asarray(pair_indices, dtype=int)
+    distance_differences = np.asarray(tdoa_matrix, dtype=float) * speed_of_sound
+
+    if distance_differences.shape[1] < 2:
+        raise ValueError(
+            "At least two microphone pairs are required to approximate the sound source."
+        )
+
+    positions = np.full((distance_differences.shape[0], 2), np.nan)
+    valid = np.all(np.isfinite(distance_differences), axis=1)
+    if not np.any(valid):
+        return positions
+
+    if mic_positions.shape[0] >= 3:
+        estimates = _closed_form_batch(
+            distance_differences=distance_differences[valid],
+            mic_positions=mic_positions,
+            pair_indices=pair_indices,
+        )
+    elif solver == "closed_form":
+        raise ValueError(
+            "At least three microphones are required for the closed-form solution."
+        )
+    else:
+        estimates = np.tile(np.mean(mic_positions, axis=0), (np.sum(valid), 1))
+
+    if solver == "gauss_newton":
+        estimates = _gauss_newton_batch(
+            distance_differences=distance_differences[valid],
+            mic_positions=mic_positions,
+            pair_indices=pair_indices,
+            initial_guess=estimates,
+            max_iterations=max_iterations,
+        )
+
+    positions[valid] = estimates
+
+    return positions
+
+
+def _closed_form_batch(
+    distance_differences: np.ndarray,
+    mic_positions: np.ndarray,
+    pair_indices: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized spherical intersection over a batch of chunks, see multilaterate_closed_form().
+
+    Args:
+        distance_differences (np.ndarray): The distance differences in meters, of shape (n_chunks, n_pairs).
+        mic_positions (np.ndarray): The (x, y) positions of the microphones, of shape (n_mics, 2).
+        pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+
+    Returns:
+        np.ndarray: The estimated (x, y) coordinates of each chunk, of shape (n_chunks, 2).
+    """
+    num_mics = mic_positions.shape[0]
+    first, second = pair_indices[:, 0], pair_indices[:, 1]
+
+    # Range differences relative to the reference microphone 0 (least squares over all pairs)
+    incidence = np.zeros((len(pair_indices), num_mics - 1))
+    rows = np.arange(len(pair_indices))
+    incidence[rows[first > 0], first[first > 0] - 1] += 1
+    incidence[rows[second > 0], second[second > 0] - 1] -= 1
+    d = distance_differences @ np.linalg.pinv(incidence).T
+
+    # Linear system A @ [x, y] = b + 2 * d * r_0, i.e. p = u + v * r_0
+    reference = mic_positions[0]
+    others = mic_positions[1:]
+    A_pinv = np.linalg.pinv(-2 * (others - reference))
+    b = d**2 - np.sum(others**2, axis=1) + np.sum(reference**2)
+    u = b @ A_pinv.T
+    v = (2 * d) @ A_pinv.T
+
+    # Substitute p = u + v * r_0 into r_0^2 = |p - m_0|^2
+    w = u - reference
+    qa = np.sum(v * v, axis=1) - 1
+    qb = 2 * np.sum(v * w, axis=1)
+    qc = np.sum(w * w, axis=1)
+    linear = np.abs(qa) < 1e-12
+    safe_qa = np.where(linear, 1.0, qa)
+    safe_qb = np.where(np.abs(qb) > 1e-12, qb, 1.0)
+    # Without an exact solution, the r_0 closest to satisfying the constraint is taken
+    root = np.sqrt(np.maximum(qb**2 - 4 * qa * qc, 0))
+    candidates = np.stack(
+        [(-qb - root) / (2 * safe_qa), (-qb + root) / (2 * safe_qa)], axis=1
+    )
+    linear_root = np.where(np.abs(qb) > 1e-12, -qc / safe_qb, 0.0)
+    candidates[linear] = linear_root[linear, np.newaxis]
+
+    # Negative ranges are invalid, replace them by the other candidate (or 0 if none is valid)
+    candidates[candidates < 0] = np.nan
+    candidates = np.where(np.isnan(candidates), candidates[:, ::-1], candidates)
+    candidates = np.nan_to_num(candidates, nan=0.0)
+
+    # Pick the candidate that best satisfies the original hyperbolic equations. With three microphones,
+    # both candidates may satisfy them exactly, in which case the one closer to the microphones is taken.
+    positions = u[:, np.newaxis, :] + candidates[:, :, np.newaxis] * v[:, np.newaxis, :]
+    distances = np.linalg.norm(
+        positions[:, :, np.newaxis, :] - mic_positions[np.newaxis, np.newaxis, :, :],
+        axis=-1,
+    )
+    residuals = (
+        distances[:, :, first]
+        - distances[:, :, second]
+        - distance_differences[:, np.newaxis, :]
+    )
+    costs = np.sum(residuals**2, axis=2)
+    tolerance = 1e-9 * (1 + np.sum(distance_differences**2, axis=1))
+    ambiguous = costs <= np.min(costs, axis=1, keepdims=True) + tolerance[:, np.newaxis]
+    spread = np.linalg.norm(positions - np.mean(mic_positions, axis=0), axis=2)
+    choice = np.argmin(np.where(ambiguous, spread, np.inf), axis=1)
+
+    return positions[np.arange(len(positions)), choice]
+
+
+def _gauss_newton_batch(
+    distance_differences: np.ndarray,
+    mic_positions: np.ndarray,
+    pair_indices: np.ndarray,
+    initial_guess: np.ndarray,
+    max_iterations: int = 50,
+    tolerance: float = 1e-10,
+) -> np.ndarray:
+    """
+    Minimizes the hyperbolic TDoA equations of a batch of chunks with damped Gauss-Newton (Levenberg-Marquardt) iterations.
+
+    Args:
+        distance_differences (np.ndarray): The distance differences in meters, of shape (n_chunks, n_pairs).
+        mic_positions (np.ndarray): The (x, y) positions of the microphones, of shape (n_mics, 2).
+        pair_indices (np.ndarray): The indices into mic_positions of mic1 and mic2 of each pair, of shape (n_pairs, 2).
+        initial_guess (np.ndarray): The (x, y) positions to start from, of shape (n_chunks, 2).
+        max_iterations (int): Maximum number of iterations. Defaults to 50.
+        tolerance (float): Stop once no position moves by more than this distance. Defaults to 1e-10.
+
+    Returns:
+        np.ndarray: The refined (x, y) coordinates of each chunk, of shape (n_chunks, 2).
+    """
+    first_positions = mic_positions[pair_indices[:, 0]]
+    second_positions = mic_positions[pair_indices[:, 1]]
+
+    def evaluate(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        delta1 = positions[:, np.newaxis, :] - first_positions
+        delta2 = positions[:, np.newaxis, :] - second_positions
+        dist1 = np.maximum(np.linalg.norm(delta1, axis=2), 1e-12)
+        dist2 = np.maximum(np.linalg.norm(delta2, axis=2), 1e-12)
+        residuals = dist1 - dist2 - distance_differences
+        jacobian = delta1 / dist1[:, :, np.newaxis] - delta2 / dist2[:, :, np.newaxis]
+        return residuals, jacobian
+
+    positions = np.array(initial_guess, dtype=float)
+    residuals, jacobian = evaluate(positions)
+    costs = np.sum(residuals**2, axis=1)
+    damping = np.full(len(positions), 1e-3)
+
+    for _ in range(max_iterations):
+        normal_matrix = np.einsum("bpi,bpj->bij", jacobian, jacobian)
+        normal_matrix += damping[:, np.newaxis, np.newaxis] * np.eye(2)
+        gradient = np.einsum("bpi,bp->bi", jacobian, residuals)
+        steps = -np.linalg.solve(normal_matrix, gradient[:, :, np.newaxis])[:, :, 0]
+
+        new_residuals, new_jacobian = evaluate(positions + steps)
+        new_costs = np.sum(new_residuals**2, axis=1)
+        improved = new_costs < costs
+
+        positions[improved] += steps[improved]
+        residuals[improved] = new_residuals[improved]
+        jacobian[improved] = new_jacobian[improved]
+        costs[improved] = new_costs[improved]
+        damping = np.where(improved, damping * 0.3, np.minimum(damping * 10, 1e12))
+
+        # Rejected steps shrink as the damping grows, so every chunk eventually meets the tolerance
+        if np.all(
+            np.linalg.norm(steps, axis=1)
+            < tolerance * (1 + np.linalg.norm(positions, axis=1))
+        ):
+            break
+
+    return positions
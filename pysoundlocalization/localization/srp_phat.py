@@ -0,0 +1,181 @@
+from itertools import combinations
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import pysoundlocalization.config as config
+
+
+def compute_steering_matrix(
+    arrival_times: np.ndarray,
+    sample_rate: int,
+    n_fft: int = 1024,
+    max_frequency: float | None = None,
+) -> np.ndarray:
+    """
+    Compute the per-microphone SRP-PHAT steering vectors of candidate points from their theoretical arrival times.
+
+    The steering vector exp(j * 2 * pi * f * t) is stored for every point, microphone and frequency bin. The
+    steering of a microphone pair is formed from the vectors of its two microphones when the power is evaluated
+    (see steered_power()), so the matrix grows linearly with the number of microphones: it takes
+    n_points * n_mics * n_bins * 8 bytes, e.g. about 100 MB for 2100 points, 12 microphones and n_fft=1024.
+    The DC bin is omitted, as it does not carry any delay information.
+
+    Args:
+        arrival_times (np.ndarray): The propagation time in seconds from every point to every microphone, of shape (n_points, n_mics).
+        sample_rate (int): The sample rate of the audio signals in Hz.
+        n_fft (int): The FFT length of the analysis frames. Defaults to 1024.
+        max_frequency (float | None): Only the bins up to this frequency in Hz are included, e.g. to steer a coarse
+            grid with a band-limited (and therefore wider) response peak. Defaults to all bins.
+
+    Returns:
+        np.ndarray: The complex64 steering matrix of shape (n_points, n_mics, n_bins), with n_bins <= n_fft // 2.
+    """
+    freqs = np.fft.rfftfreq(n_fft, d=1 / sample_rate)[1:]
+    if max_frequency is not None:
+        freqs = freqs[freqs <= max_frequency]
+
+    arrival_times = np.asarray(arrival_times, dtype=float)
+    steering = np.empty(arrival_times.shape + (len(freqs),), dtype=np.complex64)
+    # The phase is computed in double precision, block by block to bound the temporary memory
+    points_per_block = max(1, 2**22 // max(1, steering[0].size))
+    for start in range(0, len(steering), points_per_block):
+        times = arrival_times[start : start + points_per_block, :, np.newaxis]
+        steering[start : start + points_per_block] = np.exp(2j * np.pi * times * freqs)
+    return steering
+
+
+def phat_spectra(
+    signals: np.ndarray, n_fft: int = 1024, hop: int | None = None
+) -> np.ndarray:
+    """
+    Compute the PHAT-weighted short-time spectra of the given signals.
+
+    Signals shorter than `n_fft` are zero-padded to a single frame.
+
+    Args:
+        signals (np.ndarray): The audio signals of shape (..., n_samples).
+        n_fft (int): The FFT length of the analysis frames. Defaults to 1024.
+        hop (int | None): The number of samples between consecutive frames. Defaults to n_fft // 2.
+
+    Returns:
+        np.ndarray: The unit-magnitude spectra without the DC bin, of shape (..., n_frames, n_fft // 2).
+    """
+    if hop is None:
+        hop = n_fft // 2
+
+    signals = np.asarray(signals, dtype=config.DTYPE)
+    if signals.shape[-1] < n_fft:
+        padding = [(0, 0)] * (signals.ndim - 1) + [(0, n_fft - signals.shape[-1])]
+        signals = np.pad(signals, padding)
+
+    frames = sliding_window_view(signals, n_fft, axis=-1)[..., ::hop, :]
+    window = np.hanning(n_fft).astype(config.DTYPE)
+    spectra = np.fft.rfft(frames * window, axis=-1)[..., 1:]
+    magnitude = np.abs(spectra)
+    return spectra / np.maximum(magnitude, np.finfo(config.DTYPE).tiny)
+
+
+def cross_spectra(
+    signals: np.ndarray, n_fft: int = 1024, hop: int | None = None
+) -> np.ndarray:
+    """
+    Compute the PHAT-weighted cross-spectra of all microphone pairs, accumulated over all frames of each chunk.
+
+    The spectrum of each microphone is computed once and shared by all pairs it belongs to.
+
+    Args:
+        signals (np.ndarray): The audio signals of shape (n_chunks, n_mics, n_samples).
+        n_fft (int): The FFT length of the analysis frames. Defaults to 1024.
+        hop (int | None): The number of samples between consecutive frames. Defaults to n_fft // 2.
+
+    Returns:
+        np.ndarray: The cross-spectra of shape (n_chunks, n_pairs, n_fft // 2), with the pairs in the order of
+            itertools.combinations(mics, 2).
+    """
+    if signals.ndim != 3:
+        raise ValueError(
+            "Signals must be a 3-D array of shape (n_chunks, n_mics, n_samples)."
+        )
+
+    spectra = phat_spectra(signals=signals, n_fft=n_fft, hop=hop)
+    first, second = _pair_indices(n_mics=signals.shape[1])
+    return np.sum(spectra[:, first] * np.conj(spectra[:, second]), axis=2)
+
+
+def steered_power(
+    cross: np.ndarray, steering: np.ndarray, block_bytes: int = 2**25
+) -> np.ndarray:
+    """
+    Compute the steered response power of every candidate point from the cross-spectra of a batch of chunks.
+
+    The pair steering exp(j * 2 * pi * f * (t1 - t2)) of a block of points is formed from the per-microphone
+    steering, and the power of all chunks and points of the block is evaluated in one real matrix product.
+
+    Args:
+        cross (np.ndarray): The cross-spectra of shape (n_chunks, n_pairs, n_fft // 2), see cross_spectra().
+        steering (np.ndarray): The steering matrix of shape (n_points, n_mics, n_bins), see compute_steering_matrix().
+            Only the first n_bins bins of the cross-spectra are used.
+        block_bytes (int): The approximate size in bytes of the pair steering of each block of points. Defaults to 32 MiB.
+
+    Returns:
+        np.ndarray: The steered response power of shape (n_chunks, n_points).
+    """
+    n_points, n_mics, n_bins = steering.shape
+    first, second = _pair_indices(n_mics=n_mics)
+    if cross.shape[1] != len(first) or cross.shape[2] < n_bins:
+        raise ValueError(
+            "The steering matrix does not match the number of microphones or the FFT length."
+        )
+
+    cross = cross[:, :, :n_bins].reshape(len(cross), -1)
+    cross_real = cross.real.astype(np.float32)
+    cross_imag = cross.imag.astype(np.float32)
+
+    power = np.empty((len(cross), n_points), dtype=np.float32)
+    points_per_block = max(1, block_bytes // (len(first) * n_bins * 8))
+    for start in range(0, n_points, points_per_block):
+        block = steering[start : start + points_per_block]
+        pair_steering = (block[:, first] * np.conj(block[:, second])).reshape(
+            len(block), -1
+        )
+        # Re(cross * steering), summed over all pairs and bins
+        power[:, start : start + len(block)] = (
+            cross_real @ pair_steering.real.T - cross_imag @ pair_steering.imag.T
+        )
+    return power
+
+
+def srp_phat_power(
+    signals: np.ndarray,
+    steering: np.ndarray,
+    n_fft: int = 1024,
+    hop: int | None = None,
+) -> np.ndarray:
+    """
+    Compute the steered response power of every candidate point for a batch of chunks.
+
+    Args:
+        signals (np.ndarray): The audio signals of shape (n_chunks, n_mics, n_samples).
+        steering (np.ndarray): The steering matrix of the candidate points, see compute_steering_matrix().
+        n_fft (int): The FFT length of the analysis frames. Must match the steering matrix. Defaults to 1024.
+        hop (int | None): The number of samples between consecutive frames. Defaults to n_fft // 2.
+
+    Returns:
+        np.ndarray: The steered response power of shape (n_chunks, n_points).
+    """
+    return steered_power(
+        cross=cross_spectra(signals=signals, n_fft=n_fft, hop=hop), steering=steering
+    )
+
+
+def _pair_indices(n_mics: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the indices of the first and second microphone of all pairs, in the order of itertools.combinations(mics, 2).
+
+    Args:
+        n_mics (int): The number of microphones.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The indices of the first and of the second microphone of each pair.
+    """
+    pairs = np.array(list(combinations(range(n_mics), 2))).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
@@ -1,6 +1,6 @@
 from pysoundlocalization.core.TdoaPair import TdoaPair
-from pysoundlocalization.localization.gcc_phat import gcc_phat
-from itertools import combinations
+from pysoundlocalization.core.Microphone import Microphone
+from pysoundlocalization.localization.gcc_phat import gcc_phat_all_pairs
 import numpy as np
 
 
@@ -9,7 +9,8 @@ def get_all_tdoa_of_chunk_index_by_gcc_phat(
     chunk_index: int = 0,
     threshold: float = 0.5,
     debug: bool = False,
-) -> TdoaPair | None:
+    refinement: str | None = "sinc",
+) -> list[TdoaPair] | None:
     """
     Compute TDoA for all microphone pairs in the environment.
 
@@ -18,6 +19,7 @@ def get_all_tdoa_of_chunk_index_by_gcc_phat(
         chunk_index (int): The index of the chunk to compute TDoA for.
         threshold (float): The threshold for the audio signal.
         debug (bool): Print debug information if True.
+        refinement (str | None): Sub-sample peak estimation mode of GCC-PHAT, see gcc_phat(). Defaults to "sinc".
 
     Returns:
         list[TdoaPair] | None: A list of TdoaPair objects representing the computed TDoA for each microphone pair.
@@ -26,46 +28,81 @@ def get_all_tdoa_of_chunk_index_by_gcc_phat(
     if len(environment.get_mics()) < 2:
         raise ValueError("At least two microphones are required to compute TDoA.")
 
-    sample_rate = environment.get_lowest_sample_rate()
-    max_tau = environment.get_max_tau()
-
-    tdoa_results = []
-
-    # Iterate over all possible pairs of microphones
-    for mic1, mic2 in combinations(environment.get_mics(), 2):
-        # Retrieve the audio signals from each microphone
-        audio1 = mic1.get_audio().get_audio_signal(index=chunk_index)
-        audio2 = mic2.get_audio().get_audio_signal(index=chunk_index)
+    mics = []
+    signals = []
+    for mic in environment.get_mics():
+        audio_signal = mic.get_audio().get_audio_signal(index=chunk_index)
 
         # Be aware that if audio signals are not the same length, the chunking can result
         # that we have different amount of chunks per mic. This can lead to problems here.
         # Therefore, make sure that audio signals have identical length in the preprocessing step.
-        # Check if both microphones have valid audio signals
-        if audio1 is not None and audio2 is not None:
+        if audio_signal is None:
+            print(f"Missing audio signal for mic at {mic.get_position()}")
+            continue
+
+        mics.append(mic)
+        signals.append(audio_signal)
+
+    return get_all_tdoa_of_signals_by_gcc_phat(
+        mics=mics,
+        signals=np.stack(signals),
+        sample_rate=environment.get_lowest_sample_rate(),
+        max_tau=environment.get_max_tau(),
+        threshold=threshold,
+        debug=debug,
+        refinement=refinement,
+    )
+
+
+def get_all_tdoa_of_signals_by_gcc_phat(
+    mics: list[Microphone],
+    signals: np.ndarray,
+    sample_rate: int,
+    max_tau: float | None = None,
+    threshold: float = 0.5,
+    debug: bool = False,
+    refinement: str | None = "sinc",
+) -> list[TdoaPair] | None:
+    """
+    Compute TDoA for all microphone pairs given the stacked audio signals of the microphones.
 
-            # If the audio signals do not contain a dominant signal, don't compute TDoA
-            if np.max(np.abs(audio1)) < threshold or np.max(np.abs(audio2)) < threshold:
-                if debug:
-                    print(
-                        f"Audio signals for mics at {mic1.get_position()} and {mic2.get_position()} do not contain a dominant signal."
-                    )
-                return None
+    The spectrum of each microphone signal is computed only once, and all pairwise cross-spectra
+    are formed from these cached spectra.
 
-            # Compute TDoA using the compute_tdoa method
-            tdoa, cc = gcc_phat(
-                sig=audio1, refsig=audio2, fs=sample_rate, max_tau=max_tau
-            )
+    Args:
+        mics (list[Microphone]): The microphones, in the same order as the rows of `signals`.
+        signals (np.ndarray): The audio signals as a 2-D array of shape (n_mics, n_samples).
+        sample_rate (int): The sample rate of the audio signals in Hz.
+        max_tau (float | None): Maximum allowable time delay in seconds. Limits the search window.
+        threshold (float): The threshold for the audio signal.
+        debug (bool): Print debug information if True.
+        refinement (str | None): Sub-sample peak estimation mode of GCC-PHAT, see gcc_phat(). Defaults to "sinc",
+            which yields the same TDoA as the 16x oversampled inverse FFT without computing it.
 
-            tdoa_pair = TdoaPair(mic1=mic1, mic2=mic2, tdoa=tdoa)
+    Returns:
+        list[TdoaPair] | None: A list of TdoaPair objects representing the computed TDoA for each microphone pair.
+    """
+    # If any of the audio signals does not contain a dominant signal, don't compute TDoA
+    peaks = np.max(np.abs(signals), axis=1)
+    if np.any(peaks < threshold):
+        if debug:
+            for mic, peak in zip(mics, peaks):
+                if peak < threshold:
+                    print(
+                        f"Audio signal for mic at {mic.get_position()} does not contain a dominant signal."
+                    )
+        return None
 
-            tdoa_results.append(tdoa_pair)
+    pairs, taus = gcc_phat_all_pairs(
+        signals=signals, fs=sample_rate, max_tau=max_tau, refinement=refinement
+    )
 
-            if debug:
-                print(str(tdoa_pair))
+    tdoa_results = []
+    for (i, j), tdoa in zip(pairs, taus):
+        tdoa_pair = TdoaPair(mic1=mics[i], mic2=mics[j], tdoa=float(tdoa))
+        tdoa_results.append(tdoa_pair)
 
-        else:
-            print(
-                f"Missing audio signal(s) for mics at {mic1.get_position()} and {mic2.get_position()}"
-            )
+        if debug:
+            print(str(tdoa_pair))
 
     return tdoa_results
@@ -1,5 +1,7 @@
 from pysoundlocalization.core.TdoaPair import TdoaPair
 from pysoundlocalization.core.Microphone import Microphone
+from itertools import combinations
+import numpy as np
 
 
 def get_all_tdoa_of_chunk_index_by_threshold(
@@ -7,7 +9,7 @@ def get_all_tdoa_of_chunk_index_by_threshold(
     chunk_index: int = 0,
     threshold: float = 0.5,
     debug: bool | None = False,
-) -> list[TdoaPair]:
+) -> list[TdoaPair] | None:
     """
     Compute TDoA for all microphone pairs in the environment based on a threshold.
 
@@ -18,41 +20,63 @@ def get_all_tdoa_of_chunk_index_by_threshold(
         debug (bool): Print debug information if True.
 
     Returns:
-        list[TdoaPair]: A list of TdoaPair objects representing the computed TDoA for each microphone pair.
+        list[TdoaPair] | None: A list of TdoaPair objects representing the computed TDoA for each microphone pair.
     """
+    mics = environment.get_mics()
 
-    def compute_sample_index_threshold(mic: Microphone, debug: bool = False) -> int:
-        for i, sample in enumerate(mic.get_audio().get_audio_signal(index=chunk_index)):
-            if abs(sample) > threshold:
-                if debug:
-                    print(
-                        f"Mic {mic.get_name()} sample index: {i} has exceeded threshold"
-                    )
-                return i
+    return get_all_tdoa_of_signals_by_threshold(
+        mics=mics,
+        signals=np.stack(
+            [mic.get_audio().get_audio_signal(index=chunk_index) for mic in mics]
+        ),
+        sample_rate=mics[0].get_audio().get_sample_rate(),
+        threshold=threshold,
+        debug=debug,
+    )
 
-    tdoa_pairs = []
 
-    for i in range(len(environment.get_mics())):
-        mic1 = environment.get_mics()[i]
-        mic1_sample_index = compute_sample_index_threshold(mic=mic1, debug=debug)
+def get_all_tdoa_of_signals_by_threshold(
+    mics: list[Microphone],
+    signals: np.ndarray,
+    sample_rate: int,
+    threshold: float = 0.5,
+    debug: bool | None = False,
+) -> list[TdoaPair] | None:
+    """
+    Compute TDoA for all microphone pairs based on a threshold, given the stacked audio signals of the microphones.
+
+    Args:
+        mics (list[Microphone]): The microphones, in the same order as the rows of `signals`.
+        signals (np.ndarray): The audio signals as a 2-D array of shape (n_mics, n_samples).
+        sample_rate (int): The sample rate of the audio signals in Hz.
+        threshold (float): The threshold for the audio signal.
+        debug (bool): Print debug information if True.
 
-        if mic1_sample_index is None:
-            return None
+    Returns:
+        list[TdoaPair] | None: A list of TdoaPair objects representing the computed TDoA for each microphone pair.
+    """
+    # First sample index of every mic exceeding the threshold, computed in one pass over all mics
+    exceeded = np.abs(signals) > threshold
+    sample_indices = np.argmax(exceeded, axis=1)
 
-        for j in range(i + 1, len(environment.get_mics())):
-            mic2 = environment.get_mics()[j]
-            mic2_sample_index = compute_sample_index_threshold(mic=mic2, debug=False)
+    # If the threshold is not exceeded for any of the mics, no TDoA can be computed
+    if not np.all(exceeded[np.arange(len(mics)), sample_indices]):
+        return None
 
-            if mic2_sample_index is None:
-                return None
+    if debug:
+        for mic, sample_index in zip(mics, sample_indices):
+            print(
+                f"Mic {mic.get_name()} sample index: {sample_index} has exceeded threshold"
+            )
 
-            tdoa_pairs.append(
-                TdoaPair(
-                    mic1=mic1,
-                    mic2=mic2,
-                    tdoa=(mic1_sample_index - mic2_sample_index)
-                    / mic1.get_audio().get_sample_rate(),
-                )
+    tdoa_pairs = []
+    for i, j in combinations(range(len(mics)), 2):
+        tdoa_pairs.append(
+            TdoaPair(
+                mic1=mics[i],
+                mic2=mics[j],
+                tdoa=float(sample_indices[i] - sample_indices[j]) / sample_rate,
             )
+        )
 
     return tdoa_pairs
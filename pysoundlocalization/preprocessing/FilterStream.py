@@ -0,0 +1,75 @@
+import numpy as np
+from scipy.signal import sosfilt
+import pysoundlocalization.config as config
+
+
+class FilterStream:
+    """
+    Stateful cascade of second-order sections for filtering a signal block by block.
+
+    The filter state (zi) is carried across successive calls of process(), such that filtering consecutive blocks
+    produces the same samples as filtering their concatenation in one call, without transients at the block
+    boundaries. Only the state of the filter is kept, so the memory does not grow with the length of the stream.
+
+    Args:
+        sos (np.ndarray): The second-order sections of shape (n_sections, 6).
+    """
+
+    def __init__(self, sos: np.ndarray):
+        sos = np.asarray(sos)
+        if sos.ndim != 2 or sos.shape[1] != 6:
+            raise ValueError("Second-order sections must be of shape (n_sections, 6).")
+
+        self.__sos = sos.astype(config.DTYPE)
+        self.reset()
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Filter the next block of the stream along its last axis.
+
+        Args:
+            block (np.ndarray): The next samples of shape (..., n_samples). All blocks of a stream must have the same leading shape.
+
+        Returns:
+            np.ndarray: The filtered samples of the same shape.
+        """
+        block = np.asarray(block, dtype=config.DTYPE)
+        if len(self.__sos) == 0:
+            return block.copy()
+
+        if self.__zi is None:
+            # Zero initial state, as in a one-shot sosfilt call
+            self.__zi = np.zeros(
+                (len(self.__sos),) + block.shape[:-1] + (2,), config.DTYPE
+            )
+        elif self.__zi.shape[1:-1] != block.shape[:-1]:
+            raise ValueError(
+                f"Block of shape {block.shape} does not match the stream of shape {self.__zi.shape[1:-1]}."
+            )
+
+        filtered, self.__zi = sosfilt(self.__sos, block, axis=-1, zi=self.__zi)
+        return filtered.astype(config.DTYPE, copy=False)
+
+    def reset(self) -> None:
+        """
+        Reset the filter state, e.g. to start a new stream.
+        """
+        self.__zi: np.ndarray | None = None
+
+    def get_sos(self) -> np.ndarray:
+        """
+        Get the second-order sections of the stream.
+
+        Returns:
+            np.ndarray: The second-order sections of shape (n_sections, 6).
+        """
+        return self.__sos
+
+    def get_state(self) -> np.ndarray | None:
+        """
+        Get the current filter state.
+
+        Returns:
+            np.ndarray | None: The filter state of shape (n_sections, ..., 2), or None if no block has been processed yet.
+        """
+        return self.__zi
@@ -1,26 +1,158 @@
 from pysoundlocalization.preprocessing.IFrequencyFilter import IFrequencyFilter
-from pysoundlocalization.core.Audio import Audio
+import pysoundlocalization.config as config
+import numpy as np
+from scipy.signal import oaconvolve, sosfilt, sosfiltfilt
 
 
 class FrequencyFilterChain(IFrequencyFilter):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        method: str = "auto",
+        fft_min_sections: int = 32,
+        impulse_response_tolerance: float = 1e-10,
+    ) -> None:
         """
         Initialize an empty chain of frequency filters.
+
+        The filters of the chain are compiled into one cascade of second-order sections, which is applied in a
+        single pass. For very long chains, the cascade can instead be applied in the frequency domain, by
+        convolving with its (truncated) impulse response.
+        Streams (see create_stream()) always apply the stacked second-order sections.
+
+        In zero-phase mode, the "sos" method applies the cascade forward and backward, and the "fft" method
+        convolves with the autocorrelation of the impulse response, whose spectrum is the squared magnitude
+        response of the cascade without any phase.
+
+        Args:
+            method (str): "sos" applies the stacked second-order sections with sosfilt, "fft" convolves with the
+                impulse response of the cascade, and "auto" uses "fft" for chains of at least `fft_min_sections`
+                sections. Defaults to "auto".
+            fft_min_sections (int): The number of second-order sections from which "auto" uses "fft". Defaults to 32.
+            impulse_response_tolerance (float): The impulse response is truncated once the remaining energy falls
+                below this fraction of its total energy. Defaults to 1e-10.
         """
+        if method not in ("auto", "sos", "fft"):
+            raise ValueError(f"Unknown method '{method}'. Use 'auto', 'sos' or 'fft'.")
+
         self.__filters: list[IFrequencyFilter] = []
+        self.__method = method
+        self.__fft_min_sections = fft_min_sections
+        self.__impulse_response_tolerance = impulse_response_tolerance
+        # Impulse responses by (sample rate, stacked second-order sections), as the filters may change
+        self.__impulse_responses: dict[tuple[int, bytes], np.ndarray] = {}
 
-    def apply(self, audio: Audio) -> None:
+    def __str__(self) -> str:
+        return f"FrequencyFilterChain of {len(self.__filters)} filters: {', '.join(str(filter) for filter in self.__filters)}"
+
+    def get_sos(self, sample_rate: int) -> np.ndarray:
         """
-        Apply each filter in the chain to the given audio object.
+        Get the second-order sections of all filters in the chain, stacked into one cascade.
 
         Args:
-            audio (Audio): The audio object to process with each filter.
+            sample_rate (int): The sample rate in Hz.
+
+        Returns:
+            np.ndarray: The second-order sections of shape (n_sections, 6).
         """
-        if len(audio.get_audio_signal_chunked()) > 1:
-            raise ValueError("Audio signal can not be pre-processed when chunked.")
+        if not self.__filters:
+            return np.zeros((0, 6))
+        return np.concatenate(
+            [filter.get_sos(sample_rate=sample_rate) for filter in self.__filters]
+        )
+
+    def get_impulse_response(self, sample_rate: int) -> np.ndarray:
+        """
+        Get the impulse response of the cascade, truncated once its remaining energy is negligible.
+
+        The response is cached per sample rate and second-order sections, so it is only recomputed if the filters
+        of the chain changed.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+
+        Returns:
+            np.ndarray: The read-only truncated impulse response.
+        """
+        sos = self.get_sos(sample_rate=sample_rate)
+        key = (sample_rate, np.ascontiguousarray(sos).tobytes())
+        if key not in self.__impulse_responses:
+            if len(self.__impulse_responses) >= 8:
+                self.__impulse_responses.clear()
+            self.__impulse_responses[key] = self.__compute_impulse_response(
+                sos=sos, sample_rate=sample_rate
+            )
+        return self.__impulse_responses[key]
+
+    def __compute_impulse_response(
+        self, sos: np.ndarray, sample_rate: int
+    ) -> np.ndarray:
+        """
+        Compute the impulse response of second-order sections, truncated once its remaining energy is negligible.
+
+        Args:
+            sos (np.ndarray): The second-order sections of shape (n_sections, 6).
+            sample_rate (int): The sample rate in Hz.
+
+        Returns:
+            np.ndarray: The read-only truncated impulse response.
+        """
+        length = sample_rate
+        while True:
+            impulse = np.zeros(length)
+            impulse[0] = 1.0
+            response = sosfilt(sos, impulse)
+
+            # Remaining energy after each sample, relative to the total energy
+            energy = np.cumsum(response[::-1] ** 2)[::-1]
+            negligible = energy <= self.__impulse_response_tolerance * energy[0]
+            if np.any(negligible) or length >= 64 * sample_rate:
+                break
+            length *= 2
+
+        if np.any(negligible):
+            response = response[: max(int(np.argmax(negligible)), 1)]
+        response.setflags(write=False)
+        return response
+
+    def _filter_signals(
+        self, signals: np.ndarray, sample_rate: int, zero_phase: bool = False
+    ) -> np.ndarray:
+        """
+        Apply the cascade of all filters in the chain to signals along their last axis in a single pass.
+
+        Args:
+            signals (np.ndarray): The signals of shape (..., n_samples).
+            sample_rate (int): The sample rate in Hz.
+            zero_phase (bool): If True, the cascade is applied without phase shift. Defaults to False.
+
+        Returns:
+            np.ndarray: The filtered signals of the same shape.
+        """
+        sos = self.get_sos(sample_rate=sample_rate)
+        if len(sos) == 0:
+            return np.array(signals, dtype=config.DTYPE)
+
+        if self.__method == "fft" or (
+            self.__method == "auto" and len(sos) >= self.__fft_min_sections
+        ):
+            response = self.get_impulse_response(sample_rate=sample_rate)
+            if zero_phase:
+                # Symmetric around its center, so "same" convolution does not delay the signals
+                response = np.convolve(response, response[::-1])
+                mode = "same"
+            else:
+                mode = "full"
+            response = response.reshape((1,) * (signals.ndim - 1) + (-1,))
+            filtered = oaconvolve(signals, response, mode=mode, axes=-1)
+            return filtered[..., : signals.shape[-1]].astype(config.DTYPE, copy=False)
 
-        for filter in self.__filters:
-            filter.apply(audio=audio)
+        if zero_phase:
+            return sosfiltfilt(sos.astype(config.DTYPE), signals, axis=-1).astype(
+                config.DTYPE, copy=False
+            )
+        return sosfilt(sos.astype(config.DTYPE), signals, axis=-1).astype(
+            config.DTYPE, copy=False
+        )
 
     def add_filter(self, filter: IFrequencyFilter) -> None:
         """
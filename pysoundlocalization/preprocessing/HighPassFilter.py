@@ -1,6 +1,8 @@
-from pysoundlocalization.preprocessing.IFrequencyFilter import IFrequencyFilter
-from pysoundlocalization.core.Audio import Audio
-from scipy.signal import butter, lfilter
+from pysoundlocalization.preprocessing.IFrequencyFilter import (
+    IFrequencyFilter,
+    butter_sos,
+)
+import numpy as np
 
 
 class HighPassFilter(IFrequencyFilter):
@@ -16,30 +18,24 @@ class HighPassFilter(IFrequencyFilter):
         self.__cutoff_frequency = cutoff_frequency
         self.__order = order
 
-    def apply(self, audio: Audio):
+    def __str__(self) -> str:
+        return f"HighPassFilter with cutoff frequency {self.__cutoff_frequency} Hz and order {self.__order}"
+
+    def get_sos(self, sample_rate: int) -> np.ndarray:
         """
-        Apply the high-pass filter to the given audio signal.
+        Get the second-order sections of the Butterworth high-pass filter for a sample rate.
 
         Args:
-            audio (Audio): The audio object to apply the filter to. The filter modifies the audio in-place.
-        """
-        print(
-            f"Applying HighPassFilter with cutoff frequency {self.__cutoff_frequency} Hz and order {self.__order}"
-        )
+            sample_rate (int): The sample rate in Hz.
 
+        Returns:
+            np.ndarray: The second-order sections of shape (n_sections, 6).
         """
-        Nyquist Sampling Theorem: sample_rate >= 2 * max_frequency
-        nyquist = 0.5 * sample_rate
-        """
-        nyquist = 0.5 * audio.get_sample_rate()
-        normalized_cutoff = self.__cutoff_frequency / nyquist
-
-        # Create the Butterworth filter
-        b, a = butter(self.__order, normalized_cutoff, btype="high", analog=False)
-
-        # Apply the filter to the audio signal
-        audio.set_audio_signal(
-            audio_signal=lfilter(b, a, audio.get_audio_signal(index=0))
+        return butter_sos(
+            order=self.__order,
+            cutoff_frequency=self.__cutoff_frequency,
+            sample_rate=sample_rate,
+            btype="high",
         )
 
     def get_cutoff_frequency(self) -> float:
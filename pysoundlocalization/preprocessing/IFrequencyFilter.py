@@ -1,21 +1,202 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import numpy as np
+from scipy.signal import butter, iirnotch, sosfilt, sosfiltfilt, tf2sos
 from pysoundlocalization.core.Audio import Audio
+from pysoundlocalization.core.Environment import Environment
+from pysoundlocalization.preprocessing.FilterStream import FilterStream
+import pysoundlocalization.config as config
 
 
 class IFrequencyFilter(ABC):
     """
     Interface for frequency filter classes, providing a method to apply a filter to an Audio object.
+
+    Filters are described by second-order sections (see get_sos()), which are applied with a single
+    sosfilt call along the last axis of all chunks of an audio, or of all mics of an environment.
+    Block-wise input, e.g. live or block-read audio, is filtered with a stream (see create_stream()).
+
+    In zero-phase mode, the sections are applied forward and backward (sosfiltfilt). This cancels the
+    frequency-dependent group delay of the filter, which would otherwise shift the signals of mics with
+    different spectra by different amounts and bias their TDoAs.
     """
 
+    def apply(
+        self, audio: Audio, continuous: bool = False, zero_phase: bool = False
+    ) -> None:
+        """
+        Apply the filter to the given Audio object. By default, each chunk of a chunked audio signal is filtered separately.
+
+        Args:
+            audio (Audio): The audio object to apply the filter to. The filter modifies the audio in-place.
+            continuous (bool): If True, the chunks are filtered as one continuous signal, carrying the filter
+                state across chunk boundaries instead of restarting from zero state in every chunk. Defaults to False.
+            zero_phase (bool): If True, the filter is applied forward and backward, such that it does not delay
+                the signal. Defaults to False.
+        """
+        print(f"Applying {self}")
+
+        if continuous and zero_phase:
+            # Zero-phase filtering is not causal, so the chunks are filtered as one signal
+            audio_signal_chunked = audio.get_audio_signal_chunked()
+            audio.set_audio_signal_chunked(
+                audio_signal_chunked=self._filter_signals(
+                    signals=audio_signal_chunked.reshape(-1),
+                    sample_rate=audio.get_sample_rate(),
+                    zero_phase=True,
+                ).reshape(audio_signal_chunked.shape)
+            )
+            return
+
+        if continuous:
+            stream = self.create_stream(sample_rate=audio.get_sample_rate())
+            audio.set_audio_signal_chunked(
+                audio_signal_chunked=np.stack(
+                    [
+                        stream.process(block=chunk)
+                        for chunk in audio.get_audio_signal_chunked()
+                    ]
+                )
+            )
+            return
+
+        audio.set_audio_signal_chunked(
+            audio_signal_chunked=self._filter_signals(
+                signals=audio.get_audio_signal_chunked(),
+                sample_rate=audio.get_sample_rate(),
+                zero_phase=zero_phase,
+            )
+        )
+
+    def apply_environment(
+        self, environment: Environment, zero_phase: bool = False
+    ) -> None:
+        """
+        Apply the filter to the audio of all mics in the environment at once.
+
+        The audio signals of all mics must have the same sample rate and number of samples.
+
+        Args:
+            environment (Environment): The environment whose mic audio is filtered in-place.
+            zero_phase (bool): If True, the filter is applied forward and backward, such that it does not delay
+                the signals. Defaults to False.
+        """
+        print(f"Applying {self} to {len(environment.get_mics())} mics")
+
+        sample_rate = environment.get_sample_rate()
+        audios = [mic.get_audio() for mic in environment.get_mics()]
+
+        if all(audio.get_num_chunks() == 1 for audio in audios):
+            environment.set_stacked_audio_signals(
+                audio_signals=self._filter_signals(
+                    signals=environment.get_stacked_audio_signals(),
+                    sample_rate=sample_rate,
+                    zero_phase=zero_phase,
+                )
+            )
+            return
+
+        filtered = self._filter_signals(
+            signals=np.stack([audio.get_audio_signal_chunked() for audio in audios]),
+            sample_rate=sample_rate,
+            zero_phase=zero_phase,
+        )
+        for audio, audio_signal_chunked in zip(audios, filtered):
+            audio.set_audio_signal_chunked(audio_signal_chunked=audio_signal_chunked)
+
     @abstractmethod
-    def apply(self, audio: Audio) -> Audio:
+    def get_sos(self, sample_rate: int) -> np.ndarray:
         """
-        Apply the filter to the given Audio object.
+        Get the second-order sections of the filter for a sample rate.
 
         Args:
-            audio (Audio): The audio object to apply the filter to.
+            sample_rate (int): The sample rate in Hz.
 
         Returns:
-            Audio: The processed audio object after applying the filter.
+            np.ndarray: The second-order sections of shape (n_sections, 6).
         """
         pass
+
+    def create_stream(self, sample_rate: int) -> FilterStream:
+        """
+        Create a stream that filters successive blocks of a signal, carrying the filter state across blocks.
+
+        The concatenated output of the stream is identical to filtering the concatenated blocks in one call.
+        Streams are causal, so there is no zero-phase mode.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+
+        Returns:
+            FilterStream: A stream with zero initial state.
+        """
+        return FilterStream(sos=self.get_sos(sample_rate=sample_rate))
+
+    def _filter_signals(
+        self, signals: np.ndarray, sample_rate: int, zero_phase: bool = False
+    ) -> np.ndarray:
+        """
+        Filter signals along their last axis.
+
+        Args:
+            signals (np.ndarray): The signals of shape (..., n_samples).
+            sample_rate (int): The sample rate in Hz.
+            zero_phase (bool): If True, the filter is applied forward and backward. Defaults to False.
+
+        Returns:
+            np.ndarray: The filtered signals of the same shape.
+        """
+        sos = self.get_sos(sample_rate=sample_rate)
+        if zero_phase:
+            return sosfiltfilt(sos.astype(config.DTYPE), signals, axis=-1).astype(
+                config.DTYPE, copy=False
+            )
+        return sosfilt(sos.astype(config.DTYPE), signals, axis=-1).astype(
+            config.DTYPE, copy=False
+        )
+
+
+@lru_cache(maxsize=128)
+def butter_sos(
+    order: int, cutoff_frequency: float, sample_rate: int, btype: str
+) -> np.ndarray:
+    """
+    Design a Butterworth filter as second-order sections. The result is cached per set of arguments.
+
+    Args:
+        order (int): The order of the filter.
+        cutoff_frequency (float): The cutoff frequency in Hz.
+        sample_rate (int): The sample rate in Hz.
+        btype (str): The type of the filter, "low" or "high".
+
+    Returns:
+        np.ndarray: The read-only second-order sections of shape (n_sections, 6).
+    """
+    # Nyquist Sampling Theorem: sample_rate >= 2 * max_frequency
+    nyquist = 0.5 * sample_rate
+    sos = butter(
+        order, cutoff_frequency / nyquist, btype=btype, analog=False, output="sos"
+    )
+    sos.setflags(write=False)
+    return sos
+
+
+@lru_cache(maxsize=128)
+def notch_sos(
+    target_frequency: float, quality_factor: float, sample_rate: int
+) -> np.ndarray:
+    """
+    Design a notch filter as second-order sections. The result is cached per set of arguments.
+
+    Args:
+        target_frequency (float): The frequency to cancel out in Hz.
+        quality_factor (float): The quality factor (Q), which controls the bandwidth of the notch filter.
+        sample_rate (int): The sample rate in Hz.
+
+    Returns:
+        np.ndarray: The read-only second-order sections of shape (1, 6).
+    """
+    b, a = iirnotch(target_frequency / (0.5 * sample_rate), quality_factor)
+    sos = tf2sos(b, a)
+    sos.setflags(write=False)
+    return sos
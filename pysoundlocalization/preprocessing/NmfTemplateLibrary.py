@@ -0,0 +1,241 @@
+import numpy as np
+from pysoundlocalization.core.Audio import Audio
+from pysoundlocalization.preprocessing.NonNegativeMatrixFactorization import (
+    NonNegativeMatrixFactorization,
+)
+
+
+class NmfTemplateLibrary:
+    def __init__(self, sample_rate: int, frame: int = 512, hop: int = 256):
+        """
+        Initialize an empty library of spectral templates (NMF dictionaries) of known sound types.
+
+        A template is learned once per sound type from reference recordings, e.g. from the sound bank, and can be
+        saved and loaded. The templates of several sound types are combined into the dictionary of a
+        NonNegativeMatrixFactorization, which then separates the sources in a fixed order, one per sound type, and
+        only has to solve the activations if the dictionary is fixed.
+
+        Args:
+            sample_rate (int): The sample rate in Hz of the audio the templates are learned from and applied to.
+            frame (int): Size of each audio frame for STFT. Defaults to 512.
+            hop (int): Hop size between frames for STFT. Defaults to 256.
+        """
+        self.__sample_rate = sample_rate
+        self.__frame = frame
+        self.__hop = hop
+        self.__templates: dict[str, np.ndarray] = {}
+
+    def learn(
+        self,
+        name: str,
+        audios: Audio | list[Audio],
+        n_components: int = 1,
+        random_state: int | np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """
+        Learn the template of a sound type from reference recordings and add it to the library.
+
+        Args:
+            name (str): The name of the sound type, e.g. "buzzer". An existing template of the same name is replaced.
+            audios (Audio | list[Audio]): The reference recordings of the sound type.
+            n_components (int): The number of spectral components of the template. Defaults to 1.
+            random_state (int | np.random.Generator | None): Seed or generator of the initialization. Defaults to None.
+
+        Returns:
+            np.ndarray: The template of shape (frame // 2 + 1, n_components).
+        """
+        if isinstance(audios, Audio):
+            audios = [audios]
+        for audio in audios:
+            if audio.get_sample_rate() != self.__sample_rate:
+                raise ValueError(
+                    f"Reference recording has sample rate {audio.get_sample_rate()} Hz, but the library uses {self.__sample_rate} Hz."
+                )
+
+        print(f"Learning template '{name}' from {len(audios)} reference recordings")
+
+        nmf = NonNegativeMatrixFactorization(
+            number_of_sources_to_extract=n_components,
+            sample_rate=self.__sample_rate,
+            frame=self.__frame,
+            hop=self.__hop,
+            init="nndsvda",
+            random_state=random_state,
+        )
+        template = nmf.learn_dictionary(audios=audios)
+        self.add_template(name=name, template=template)
+        return template
+
+    def add_template(self, name: str, template: np.ndarray) -> None:
+        """
+        Add a template to the library.
+
+        Args:
+            name (str): The name of the sound type. An existing template of the same name is replaced.
+            template (np.ndarray): The non-negative template of shape (frame // 2 + 1, n_components).
+        """
+        template = np.asarray(template, dtype=float)
+        if template.ndim != 2 or template.shape[0] != self.__frame // 2 + 1:
+            raise ValueError(
+                f"Template must be of shape ({self.__frame // 2 + 1}, n_components)."
+            )
+        if np.any(template < 0):
+            raise ValueError("Template must be non-negative.")
+        self.__templates[name] = template
+
+    def remove_template(self, name: str) -> None:
+        """
+        Remove a template from the library.
+
+        Args:
+            name (str): The name of the sound type.
+        """
+        if name not in self.__templates:
+            raise ValueError(f"No template named '{name}' in the library.")
+        del self.__templates[name]
+
+    def get_template(self, name: str) -> np.ndarray:
+        """
+        Get the template of a sound type.
+
+        Args:
+            name (str): The name of the sound type.
+
+        Returns:
+            np.ndarray: The template of shape (frame // 2 + 1, n_components).
+        """
+        if name not in self.__templates:
+            raise ValueError(f"No template named '{name}' in the library.")
+        return self.__templates[name]
+
+    def get_names(self) -> list[str]:
+        """
+        Get the names of all sound types in the library, in the order they were added.
+
+        Returns:
+            list[str]: The names of the sound types.
+        """
+        return list(self.__templates)
+
+    def get_dictionary(
+        self, names: list[str] | None = None
+    ) -> tuple[np.ndarray, list[list[int]]]:
+        """
+        Combine the templates of several sound types into one dictionary.
+
+        Args:
+            names (list[str] | None): The sound types in the order of the separated sources. Defaults to all
+                sound types of the library.
+
+        Returns:
+            tuple[np.ndarray, list[list[int]]]: The dictionary of shape (frame // 2 + 1, n_components) and the
+            indices of the components of each sound type.
+        """
+        if names is None:
+            names = self.get_names()
+        if not names:
+            raise ValueError("No templates selected.")
+
+        templates = [self.get_template(name=name) for name in names]
+        component_groups = []
+        start = 0
+        for template in templates:
+            component_groups.append(list(range(start, start + template.shape[1])))
+            start += template.shape[1]
+        return np.hstack(templates), component_groups
+
+    def create_nmf(
+        self,
+        names: list[str] | None = None,
+        fixed_dictionary: bool = True,
+        **kwargs,
+    ) -> NonNegativeMatrixFactorization:
+        """
+        Create a NonNegativeMatrixFactorization that separates the given sound types, one source per sound type.
+
+        Args:
+            names (list[str] | None): The sound types in the order of the separated sources. Defaults to all
+                sound types of the library.
+            fixed_dictionary (bool): If True, only the activations are solved. Otherwise, the templates are a warm
+                start of the dictionary. Defaults to True.
+            **kwargs: Further arguments of NonNegativeMatrixFactorization, e.g. max_iterations.
+
+        Returns:
+            NonNegativeMatrixFactorization: The NMF with the combined templates as dictionary.
+        """
+        dictionary, component_groups = self.get_dictionary(names=names)
+        return NonNegativeMatrixFactorization(
+            sample_rate=self.__sample_rate,
+            frame=self.__frame,
+            hop=self.__hop,
+            dictionary=dictionary,
+            component_groups=component_groups,
+            fixed_dictionary=fixed_dictionary,
+            **kwargs,
+        )
+
+    def save(self, filepath: str) -> None:
+        """
+        Save the library to a .npz file.
+
+        Args:
+            filepath (str): The path of the file.
+        """
+        names = self.get_names()
+        np.savez_compressed(
+            filepath,
+            names=np.array(names, dtype=str),
+            sample_rate=self.__sample_rate,
+            frame=self.__frame,
+            hop=self.__hop,
+            **{f"template_{i}": self.__templates[name] for i, name in enumerate(names)},
+        )
+        print(f"Template library with {len(names)} templates saved to {filepath}")
+
+    @classmethod
+    def load(cls, filepath: str) -> "NmfTemplateLibrary":
+        """
+        Load a library saved with save().
+
+        Args:
+            filepath (str): The path of the file.
+
+        Returns:
+            NmfTemplateLibrary: The loaded library.
+        """
+        with np.load(filepath) as data:
+            library = cls(
+                sample_rate=int(data["sample_rate"]),
+                frame=int(data["frame"]),
+                hop=int(data["hop"]),
+            )
+            for i, name in enumerate(data["names"]):
+                library.add_template(name=str(name), template=data[f"template_{i}"])
+        return library
+
+    def get_sample_rate(self) -> int:
+        """
+        Get the sample rate of the library.
+
+        Returns:
+            int: The sample rate in Hz.
+        """
+        return self.__sample_rate
+
+    def get_frame(self) -> int:
+        """
+        Get the STFT frame size of the library.
+
+        Returns:
+            int: The frame size in samples.
+        """
+        return self.__frame
+
+    def get_hop(self) -> int:
+        """
+        Get the STFT hop size of the library.
+
+        Returns:
+            int: The hop size in samples.
+        """
+        return self.__hop
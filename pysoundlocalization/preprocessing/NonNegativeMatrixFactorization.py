@@ -10,11 +10,12 @@ Adapted as part of a project for sound localization.
 from pysoundlocalization.core.Environment import Environment
 from pysoundlocalization.core.Audio import Audio
 from pysoundlocalization.visualization.audio_wave_plot import audio_wave_plot
-import math
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import librosa
+from scipy.signal import get_window
+import pysoundlocalization.config as config
 
 
 class NonNegativeMatrixFactorization:
@@ -25,6 +26,15 @@ class NonNegativeMatrixFactorization:
         frame: int = 512,
         hop: int = 256,
         epsilon: float = 1e-10,
+        cost_interval: int = 10,
+        threshold: float = 0.05,
+        tolerance: float | None = None,
+        max_iterations: int = 5000,
+        init: str = "random",
+        random_state: int | np.random.Generator | None = None,
+        dictionary: np.ndarray | None = None,
+        component_groups: list[list[int]] | None = None,
+        fixed_dictionary: bool = False,
     ):
         """
         Initialize the Non-Negative Matrix Factorization (NMF) class with user-defined or default parameters.
@@ -35,6 +45,26 @@ class NonNegativeMatrixFactorization:
         - frame (int): Size of each audio frame for STFT (default: 512).
         - hop (int): Hop size (overlap) between frames for STFT (default: 256).
         - epsilon (float): A small constant to prevent division by zero or log errors (default: 1e-10).
+        - cost_interval (int): Number of iterations between evaluations of the cost function (default: 10).
+        - threshold (float): Stop once the absolute cost falls below this value (default: 0.05).
+        - tolerance (float | None): Stop once the relative improvement of the cost between two evaluations falls
+          below this value. Unlike the absolute threshold, it does not scale with signal length and loudness.
+          A value such as 1e-4 usually stops much earlier at a marginally higher cost. None disables the
+          criterion (default: None).
+        - max_iterations (int): Maximum number of iterations (default: 5000).
+        - init (str): Initialization of W and H: "random" (absolute Gaussian values), "nndsvd" (deterministic,
+          from the leading singular vectors of the spectrogram) or "nndsvda" (nndsvd with its zeros replaced by
+          the mean of the spectrogram, such that multiplicative updates can still change them) (default: "random").
+        - random_state (int | np.random.Generator | None): Seed or generator of the random initialization, for
+          reproducible runs (default: None).
+        - dictionary (np.ndarray | None): A precomputed dictionary W of shape [K x n_components], e.g. from an
+          NmfTemplateLibrary, with K = frame // 2 + 1. If given, it replaces the initialization of W, and
+          `number_of_sources_to_extract` is ignored in favor of the component groups (default: None).
+        - component_groups (list[list[int]] | None): The indices of the dictionary components of each source.
+          Each source is reconstructed from the sum of its components, in the order of the groups. Defaults to one
+          component per source.
+        - fixed_dictionary (bool): If True, the dictionary is kept fixed and only the activations H are solved.
+          Otherwise, the dictionary is only a warm start (default: False).
 
         Attributes:
         - __S (int): Number of sources to extract (set from `number_of_sources_to_extract`).
@@ -42,6 +72,16 @@ class NonNegativeMatrixFactorization:
         - __HOP (int): Hop size for processing (set from `hop`).
         - __SR (int): Sampling rate (set from `sample_rate`).
         - __EPSILON (float): Small constant for numerical stability (set from `epsilon`).
+        - __COST_INTERVAL (int): Iterations between cost evaluations (set from `cost_interval`).
+        - __THRESHOLD (float): Absolute stop criterion (set from `threshold`).
+        - __TOLERANCE (float | None): Relative stop criterion (set from `tolerance`).
+        - __MAX_ITERATIONS (int): Maximum number of iterations (set from `max_iterations`).
+        - __INIT (str): Initialization method (set from `init`).
+        - __random_state (np.random.Generator): Random generator of the initialization (set from `random_state`).
+        - __dictionary (np.ndarray): Precomputed dictionary (set from `dictionary`).
+        - __component_groups (list): Indices of the components of each source (set from `component_groups`).
+        - __num_components (int): Number of components of the factorization.
+        - __FIXED_DICTIONARY (bool): Whether the dictionary is kept fixed (set from `fixed_dictionary`).
         - __V (np.ndarray): Spectrogram matrix to be factorized (initialized to None).
         - __W (np.ndarray): Basis matrix of the factorization (initialized to None).
         - __H (np.ndarray): Activation matrix of the factorization (initialized to None).
@@ -56,7 +96,46 @@ class NonNegativeMatrixFactorization:
         self.__HOP = hop
         self.__SR = sample_rate
         self.__EPSILON = epsilon
+        if cost_interval < 1:
+            raise ValueError("Cost interval must be at least 1.")
+        self.__COST_INTERVAL = cost_interval
+        if init not in ("random", "nndsvd", "nndsvda"):
+            raise ValueError(
+                f"Unknown init '{init}'. Use 'random', 'nndsvd' or 'nndsvda'."
+            )
+        self.__THRESHOLD = threshold
+        self.__TOLERANCE = tolerance
+        self.__MAX_ITERATIONS = max_iterations
+        self.__INIT = init
+        self.__random_state = np.random.default_rng(random_state)
         self.__S = number_of_sources_to_extract
+        self.__FIXED_DICTIONARY = fixed_dictionary
+        self.__dictionary = None
+        if dictionary is not None:
+            self.__dictionary = np.array(dictionary, dtype=config.DTYPE)
+            if (
+                self.__dictionary.ndim != 2
+                or self.__dictionary.shape[0] != frame // 2 + 1
+            ):
+                raise ValueError(
+                    f"Dictionary must be of shape ({frame // 2 + 1}, n_components) for a frame of {frame} samples."
+                )
+        elif fixed_dictionary:
+            raise ValueError("A fixed dictionary requires a dictionary.")
+
+        self.__num_components = (
+            self.__S if self.__dictionary is None else self.__dictionary.shape[1]
+        )
+        if component_groups is None:
+            component_groups = [[i] for i in range(self.__num_components)]
+        if sorted(i for group in component_groups for i in group) != list(
+            range(self.__num_components)
+        ):
+            raise ValueError(
+                f"Component groups must contain each of the {self.__num_components} components exactly once."
+            )
+        self.__component_groups = [list(group) for group in component_groups]
+        self.__S = len(self.__component_groups)
         self.__V = None
         self.__K = None
         self.__N = None
@@ -208,6 +287,345 @@ class NonNegativeMatrixFactorization:
 
         return results
 
+    def run_for_environment_multichannel(
+        self, environment: Environment, visualize_results: bool = False
+    ) -> dict:
+        """
+        Runs multichannel NMF on the audio of all mics in an environment, without concatenating their signals.
+
+        The spectrograms of all mics are computed in one batched STFT and stacked into a tensor of shape
+        (n_mics, K, N), which is factorized with a dictionary W shared by all mics and activations H per mic. As W is
+        shared, the order of the separated sources is the same for all mics. The separated signals of all mics are
+        reconstructed in one batched inverse STFT per source, with exactly the number of samples of the original
+        audio, so there are no seams between the mics.
+
+        Args:
+            environment (Environment): The environment to run nmf for.
+            visualize_results (bool): Whether to visualize intermediate results.
+
+        Returns:
+           A dictionary mapping each microphone to a list of Audio objects, one per source.
+        """
+        print("Running multichannel NMF for all audio signals in the environment...")
+
+        mic_audios = self.__get_environment_audios(environment=environment)
+        audio_signals = np.stack(
+            [audio.get_audio_signal_unchunked() for _, audio in mic_audios]
+        )
+        num_mics, num_samples = audio_signals.shape
+
+        stft = librosa.stft(audio_signals, n_fft=self.__FRAME, hop_length=self.__HOP)
+        _, K, N = stft.shape
+
+        # Factorizing the (K, n_mics * N) matrix of side-by-side spectrograms is equivalent to factorizing the
+        # (n_mics, K, N) tensor with a shared W and the per-mic activations H[:, m * N : (m + 1) * N]
+        self.__V = np.abs(stft).transpose(1, 0, 2).reshape(K, num_mics * N)
+        self.__V += self.__EPSILON
+        self.__factorize(visualize_results=visualize_results)
+
+        phase = np.exp(1j * np.angle(stft))
+        separated_signals = [
+            librosa.istft(
+                filtered_spectrogram.reshape(K, num_mics, N).transpose(1, 0, 2) * phase,
+                n_fft=self.__FRAME,
+                hop_length=self.__HOP,
+                length=num_samples,
+            )
+            for filtered_spectrogram in self.__generate_filtered_spectrograms()
+        ]
+        self.__reconstructed_sounds = None
+
+        results = {}
+        for m, (mic, audio) in enumerate(mic_audios):
+            results[mic] = [
+                Audio(
+                    audio_signal=separated_signal[m],
+                    sample_rate=audio.get_sample_rate(),
+                )
+                for separated_signal in separated_signals
+            ]
+
+        print("Multichannel NMF completed for all audio signals in the environment.")
+
+        return results
+
+    def run_for_environment_online(
+        self,
+        environment: Environment,
+        batch_frames: int = 512,
+        passes: int = 1,
+        iterations: int = 50,
+        forgetting_factor: float = 0.95,
+    ) -> dict:
+        """
+        Runs online (mini-batch) NMF on the audio of all mics in an environment.
+
+        Unlike run_for_environment(), neither the concatenated audio nor its full spectrogram is held in memory.
+        STFT frames are read in mini-batches of `batch_frames` frames from every mic (lazily opened audio is read
+        block by block), and the dictionary W is updated incrementally from running statistics of the batches. As
+        all mics share the same dictionary, the order of the separated sources is the same for all mics. Finally,
+        the activations of each mic are computed block by block with W fixed, and the separated signals are
+        reconstructed by streaming overlap-add with exactly the number of samples of the original audio.
+
+        Args:
+            environment (Environment): The environment to run nmf for.
+            batch_frames (int): Number of STFT frames per mic in each mini-batch.
+            passes (int): Number of passes over all mini-batches to learn the dictionary. Ignored with a fixed dictionary.
+            iterations (int): Number of multiplicative updates of the activations and of the dictionary per mini-batch.
+            forgetting_factor (float): Weight of the statistics of past mini-batches, in (0, 1].
+
+        Returns:
+           A dictionary mapping each microphone to a list of Audio objects, one per source.
+        """
+        if not 0 < forgetting_factor <= 1:
+            raise ValueError("Forgetting factor must be in (0, 1].")
+
+        print("Running online NMF for all audio signals in the environment...")
+
+        mic_audios = self.__get_environment_audios(environment=environment)
+        num_frames = 1 + mic_audios[0][1].get_num_samples() // self.__HOP
+
+        # Running statistics sum(H @ H.T) and sum(V @ H.T) of all mini-batches
+        HHt = np.zeros(
+            (self.__num_components, self.__num_components), dtype=config.DTYPE
+        )
+        VHt = np.zeros(
+            (self.__FRAME // 2 + 1, self.__num_components), dtype=config.DTYPE
+        )
+        self.__W = None if self.__dictionary is None else self.__dictionary.copy()
+
+        # A fixed dictionary is not learned, only the activations are solved when separating
+        for _ in range(0 if self.__FIXED_DICTIONARY else passes):
+            for start in range(0, num_frames, batch_frames):
+                stop = min(start + batch_frames, num_frames)
+                V = (
+                    np.hstack(
+                        [
+                            np.abs(
+                                self.__stft_frames(audio=audio, start=start, stop=stop)
+                            )
+                            for _, audio in mic_audios
+                        ]
+                    )
+                    + self.__EPSILON
+                )
+                if self.__W is None:
+                    self.__W, _ = self.__initialize(
+                        V=V, S=self.__num_components, init=self.__INIT
+                    )
+
+                H = self.__solve_activations(V=V, W=self.__W, iterations=iterations)
+                HHt *= forgetting_factor
+                HHt += H @ H.T
+                VHt *= forgetting_factor
+                VHt += V @ H.T
+
+                for _ in range(iterations):
+                    self.__W *= VHt / (self.__W @ HHt + 10e-10)
+
+        results = {}
+        for mic, audio in mic_audios:
+            separated_signals = self.__separate_online(
+                audio=audio, batch_frames=batch_frames, iterations=iterations
+            )
+            results[mic] = [
+                Audio(audio_signal=signal, sample_rate=audio.get_sample_rate())
+                for signal in separated_signals
+            ]
+
+        print("Online NMF completed for all audio signals in the environment.")
+
+        return results
+
+    def learn_dictionary(self, audios: list[Audio]) -> np.ndarray:
+        """
+        Learn a dictionary from reference recordings, e.g. to build a template library of known sound types.
+
+        The spectrograms of all recordings are factorized together, without concatenating their signals. Each
+        component of the returned dictionary is normalized to unit norm.
+
+        Args:
+            audios (list[Audio]): The reference recordings.
+
+        Returns:
+            np.ndarray: The dictionary W of shape [K x number_of_sources_to_extract].
+        """
+        if not audios:
+            raise ValueError("No reference recordings provided.")
+
+        V = (
+            np.hstack(
+                [
+                    np.abs(
+                        librosa.stft(
+                            audio.get_audio_signal_unchunked(),
+                            n_fft=self.__FRAME,
+                            hop_length=self.__HOP,
+                        )
+                    )
+                    for audio in audios
+                ]
+            )
+            + self.__EPSILON
+        )
+        W, _, _ = self.__NMF(
+            V=V,
+            S=self.__num_components,
+            threshold=self.__THRESHOLD,
+            MAXITER=self.__MAX_ITERATIONS,
+            tolerance=self.__TOLERANCE,
+            init=self.__INIT,
+            W_init=self.__dictionary,
+            costEveryNiter=self.__COST_INTERVAL,
+        )
+        return W / np.maximum(np.linalg.norm(W, axis=0), self.__EPSILON)
+
+    def __get_environment_audios(self, environment: Environment) -> list:
+        """
+        Get the audio of all mics in an environment that have audio, and check that they can be separated together.
+
+        Args:
+            environment (Environment): The environment.
+
+        Returns:
+            list: The (mic, audio) pairs of all mics with audio.
+        """
+        mics = environment.get_mics()
+        if not mics:
+            raise ValueError("No microphones found in the environment.")
+
+        mic_audios = []
+        for mic in mics:
+            audio = mic.get_audio()
+            if audio is None:
+                print(
+                    f"Warning: No audio data found for microphone {mic.get_name()}. Skipping."
+                )
+                continue
+            if mic_audios:
+                reference = mic_audios[0][1]
+                if audio.get_sample_rate() != reference.get_sample_rate():
+                    raise ValueError(
+                        f"Sample rate mismatch detected! All audio must have same sample rate."
+                    )
+                if audio.get_num_samples() != reference.get_num_samples():
+                    raise ValueError(
+                        f"Number of samples mismatch detected! All audio must have same number of samples."
+                    )
+            mic_audios.append((mic, audio))
+
+        if not mic_audios:
+            raise ValueError("No valid audio data found in the environment.")
+
+        return mic_audios
+
+    def __stft_frames(self, audio: Audio, start: int, stop: int) -> np.ndarray:
+        """
+        Compute the STFT frames from start to stop of an audio, reading only the samples these frames cover.
+
+        The frames are identical to the corresponding frames of librosa.stft() of the whole audio signal (centered
+        frames with zero padding).
+
+        Args:
+            audio (Audio): The audio.
+            start (int): Index of the first frame.
+            stop (int): Index after the last frame.
+
+        Returns:
+            np.ndarray: The complex STFT frames of shape [K x (stop - start)].
+        """
+        num_samples = audio.get_num_samples()
+        first = start * self.__HOP - self.__FRAME // 2
+        last = (stop - 1) * self.__HOP + self.__FRAME - self.__FRAME // 2
+        segment = audio.read_samples(start=max(first, 0), stop=min(last, num_samples))
+        segment = np.pad(segment, (max(-first, 0), max(last - num_samples, 0)))
+        return librosa.stft(
+            segment, n_fft=self.__FRAME, hop_length=self.__HOP, center=False
+        )
+
+    def __solve_activations(self, V, W, iterations):
+        """
+        Compute the activations of a spectrogram for a fixed dictionary by multiplicative updates (beta=2).
+
+        Each column of H only depends on the same column of V, such that spectrograms can be processed block by block.
+
+        Args:
+            V (np.ndarray): The spectrogram of shape [KxN].
+            W (np.ndarray): The dictionary of shape [KxS].
+            iterations (int): The number of multiplicative updates.
+
+        Returns:
+            np.ndarray: The activations of shape [SxN].
+        """
+        WtV = W.T @ V
+        WtW = W.T @ W
+        H = WtV / (np.sum(WtW, axis=1, keepdims=True) + 10e-10)
+        denominator = np.empty_like(H)
+        for _ in range(iterations):
+            np.matmul(WtW, H, out=denominator)
+            denominator += 10e-10
+            H *= WtV / denominator
+        return H
+
+    def __separate_online(
+        self, audio: Audio, batch_frames: int, iterations: int
+    ) -> np.ndarray:
+        """
+        Separate the sources of an audio with the learned dictionary, block by block.
+
+        Args:
+            audio (Audio): The audio to separate.
+            batch_frames (int): Number of STFT frames per block.
+            iterations (int): Number of multiplicative updates of the activations per block.
+
+        Returns:
+            np.ndarray: The separated signals of shape (n_sources, n_samples).
+        """
+        num_samples = audio.get_num_samples()
+        num_frames = 1 + num_samples // self.__HOP
+        window = get_window("hann", self.__FRAME, fftbins=True)
+
+        # Overlap-add buffers of the (zero padded) signals, as in librosa.istft()
+        length = num_frames * self.__HOP + self.__FRAME
+        separated = np.zeros((self.__S, length), dtype=config.DTYPE)
+        window_sum = np.zeros(length, dtype=config.DTYPE)
+
+        for start in range(0, num_frames, batch_frames):
+            stop = min(start + batch_frames, num_frames)
+            stft = self.__stft_frames(audio=audio, start=start, stop=stop)
+            V = np.abs(stft) + self.__EPSILON
+            H = self.__solve_activations(V=V, W=self.__W, iterations=iterations)
+
+            WH = self.__W @ H + self.__EPSILON
+            phase = np.exp(1j * np.angle(stft))
+            masks = np.stack(
+                [
+                    self.__W[:, group] @ H[group] / WH
+                    for group in self.__component_groups
+                ]
+            )
+            frames = (
+                np.fft.irfft(masks * V * phase, n=self.__FRAME, axis=1)
+                * window[:, np.newaxis]
+            )
+
+            # Add the frames (of shape [S x FRAME x n]) to the signals, one hop-sized segment of each frame at a time
+            num_block_frames = stop - start
+            for offset in range(0, self.__FRAME, self.__HOP):
+                width = min(self.__HOP, self.__FRAME - offset)
+                begin = start * self.__HOP + offset
+                end = begin + num_block_frames * self.__HOP
+                separated[:, begin:end].reshape(self.__S, num_block_frames, self.__HOP)[
+                    ..., :width
+                ] += np.swapaxes(frames[:, offset : offset + width], 1, 2)
+                window_sum[begin:end].reshape(num_block_frames, self.__HOP)[
+                    :, :width
+                ] += (window[offset : offset + width] ** 2)
+
+        nonzero = window_sum > np.finfo(window_sum.dtype).tiny
+        separated[:, nonzero] /= window_sum[nonzero]
+        return separated[:, self.__FRAME // 2 : self.__FRAME // 2 + num_samples]
+
     def __run(self, audio: Audio, visualize_results: bool = False):
         """
         Orchestrates the nfm algorithm.
@@ -225,17 +643,7 @@ class NonNegativeMatrixFactorization:
         sound_stft_angle = np.angle(sound_stft)
 
         self.__V = sound_sftf_magnitude + self.__EPSILON
-
-        beta = 2
-        self.__W, self.__H, self.__cost_function = self.__NMF(
-            V=self.__V,
-            S=self.__S,
-            beta=beta,
-            threshold=0.05,
-            MAXITER=5000,
-            display=visualize_results,
-            displayEveryNiter=1000,
-        )
+        self.__factorize(visualize_results=visualize_results)
 
         filtered_spectrograms = self.__generate_filtered_spectrograms()
         reconstructed_sounds = self.__reconstruct_sounds(
@@ -251,6 +659,29 @@ class NonNegativeMatrixFactorization:
 
         return reconstructed_sounds
 
+    def __factorize(self, visualize_results: bool = False) -> None:
+        """
+        Factorize the spectrogram V with the settings of this object, and store W, H and the cost function.
+
+        Args:
+            visualize_results (bool): Set to true if the intermediate factorizations should be visualized.
+        """
+        beta = 2
+        self.__W, self.__H, self.__cost_function = self.__NMF(
+            V=self.__V,
+            S=self.__num_components,
+            beta=beta,
+            threshold=self.__THRESHOLD,
+            MAXITER=self.__MAX_ITERATIONS,
+            tolerance=self.__TOLERANCE,
+            init=self.__INIT,
+            W_init=self.__dictionary,
+            update_W=not self.__FIXED_DICTIONARY,
+            display=visualize_results,
+            displayEveryNiter=1000,
+            costEveryNiter=self.__COST_INTERVAL,
+        )
+
     def __NMF(
         self,
         V,
@@ -258,8 +689,13 @@ class NonNegativeMatrixFactorization:
         beta=2,
         threshold=0.05,
         MAXITER=5000,
+        tolerance=None,
+        init="random",
+        W_init=None,
+        update_W=True,
         display=False,
         displayEveryNiter=None,
+        costEveryNiter=1,
     ):
         """
         inputs :
@@ -268,10 +704,15 @@ class NonNegativeMatrixFactorization:
             V         : Mixture signal : |TFST|
             S         : The number of sources to extract
             beta      : Beta divergence considered, default=2 (Euclidean)
-            threshold : Stop criterion
+            threshold : Stop criterion on the absolute cost
             MAXITER   : The number of maximum iterations, default=1000
+            tolerance : Stop criterion on the relative improvement of the cost between two evaluations, or None
+            init      : Initialization of W and H, "random", "nndsvd" or "nndsvda"
+            W_init    : Precomputed dictionary [KxS] to start from instead of init, or None
+            update_W  : Whether to update W, or to only solve the activations H
             display   : Display plots during optimization :
             displayEveryNiter : only display last iteration
+            costEveryNiter : evaluate the cost function (and the stop criterion) every n iterations only
 
 
         outputs :
@@ -279,75 +720,192 @@ class NonNegativeMatrixFactorization:
 
             W : dictionary matrix [KxS], W>=0
             H : activation matrix [SxN], H>=0
-            cost_function : the optimised cost function over iterations
+            cost_function : the optimised cost function over the evaluated iterations
 
         Algorithm :
         -----------
 
-        1) Randomly initialize W and H matrices
+        1) Initialize W and H matrices (randomly or by NNDSVD)
         2) Multiplicative update of W and H
         3) Repeat step (2) until convergence or after MAXITER
 
-
+        For beta=2, the updates use the Gram matrices W.T@W and H@H.T, such that the [KxN] product W@H is never
+        formed during the updates. Otherwise, W@H is computed once per half-step into a preallocated buffer.
         """
         counter = 0
         self.__cost_function = []
-        beta_divergence = 1
+        beta_divergence = np.inf
+        relative_improvement = np.inf
 
+        V = np.asarray(V, dtype=config.DTYPE)
         self.__K, self.__N = np.shape(V)
 
-        # Initialisation of W and H matrices : The initialization is generally random
-        self.__W = np.abs(np.random.normal(loc=0, scale=2.5, size=(self.__K, S)))
-        self.__H = np.abs(np.random.normal(loc=0, scale=2.5, size=(S, self.__N)))
+        # Initialisation of W and H matrices
+        if W_init is None:
+            self.__W, self.__H = self.__initialize(V=V, S=S, init=init)
+        else:
+            self.__W = np.array(W_init, dtype=config.DTYPE)
+            WtV = self.__W.T @ V
+            self.__H = WtV / (
+                np.sum(self.__W.T @ self.__W, axis=1, keepdims=True) + 10e-10
+            )
+
+        # Preallocated buffers for the in-place multiplicative updates
+        numerator_H = np.empty((S, self.__N), dtype=config.DTYPE)
+        denominator_H = np.empty((S, self.__N), dtype=config.DTYPE)
+        numerator_W = np.empty((self.__K, S), dtype=config.DTYPE)
+        denominator_W = np.empty((self.__K, S), dtype=config.DTYPE)
+        gram = np.empty((S, S), dtype=config.DTYPE)
+        WtV = np.empty((S, self.__N), dtype=config.DTYPE) if beta == 2 else None
+        WtW = np.empty((S, S), dtype=config.DTYPE)
+        WH = None if beta == 2 else np.empty((self.__K, self.__N), dtype=config.DTYPE)
 
         # Plotting the first initialization
         if display == True:
             self._plot_NMF_iter(beta=beta, iteration=counter)
 
-        while beta_divergence >= threshold and counter <= MAXITER:
+        while (
+            beta_divergence >= threshold
+            and (tolerance is None or relative_improvement >= tolerance)
+            and counter <= MAXITER
+        ):
             # Update of W and H
-            self.__H *= (self.__W.T @ (((self.__W @ self.__H) ** (beta - 2)) * V)) / (
-                self.__W.T @ ((self.__W @ self.__H) ** (beta - 1)) + 10e-10
-            )
-            self.__W *= (((self.__W @ self.__H) ** (beta - 2) * V) @ self.__H.T) / (
-                (self.__W @ self.__H) ** (beta - 1) @ self.__H.T + 10e-10
-            )
+            if beta == 2:
+                # H *= (W.T @ V) / ((W.T @ W) @ H), where W.T @ V and W.T @ W are constant for a fixed W
+                if update_W or counter == 0:
+                    np.matmul(self.__W.T, V, out=WtV)
+                    np.matmul(self.__W.T, self.__W, out=WtW)
+                np.matmul(WtW, self.__H, out=denominator_H)
+                denominator_H += 10e-10
+                np.divide(WtV, denominator_H, out=numerator_H)
+                self.__H *= numerator_H
+
+                # W *= (V @ H.T) / (W @ (H @ H.T))
+                if update_W:
+                    np.matmul(V, self.__H.T, out=numerator_W)
+                    np.matmul(self.__H, self.__H.T, out=gram)
+                    np.matmul(self.__W, gram, out=denominator_W)
+                    denominator_W += 10e-10
+                    numerator_W /= denominator_W
+                    self.__W *= numerator_W
+            else:
+                np.matmul(self.__W, self.__H, out=WH)
+                np.matmul(self.__W.T, WH ** (beta - 2) * V, out=numerator_H)
+                np.matmul(self.__W.T, WH ** (beta - 1), out=denominator_H)
+                denominator_H += 10e-10
+                numerator_H /= denominator_H
+                self.__H *= numerator_H
+
+                if update_W:
+                    np.matmul(self.__W, self.__H, out=WH)
+                    np.matmul(WH ** (beta - 2) * V, self.__H.T, out=numerator_W)
+                    np.matmul(WH ** (beta - 1), self.__H.T, out=denominator_W)
+                    denominator_W += 10e-10
+                    numerator_W /= denominator_W
+                    self.__W *= numerator_W
 
             # Compute cost function
-            beta_divergence = self.__divergence(V=V, beta=2)
-            self.__cost_function.append(beta_divergence)
+            if counter % costEveryNiter == 0 or counter == MAXITER:
+                beta_divergence = self.__divergence(V=V, beta=beta)
+                if self.__cost_function:
+                    previous = self.__cost_function[-1]
+                    relative_improvement = (previous - beta_divergence) / max(
+                        previous, np.finfo(float).tiny
+                    )
+                self.__cost_function.append(beta_divergence)
 
             if display == True and counter % displayEveryNiter == 0:
                 self._plot_NMF_iter(beta=beta, iteration=counter)
 
             counter += 1
 
-        if counter - 1 == MAXITER:
+        if counter - 1 == MAXITER and beta_divergence >= threshold:
             print(f"Stop after {MAXITER} iterations.")
         else:
             print(f"Convergence after {counter-1} iterations.")
 
         return self.__W, self.__H, self.__cost_function
 
+    def __initialize(self, V, S, init="random"):
+        """
+        Initialize the dictionary and activation matrices.
+
+        NNDSVD (Boutsidis & Gallopoulos, 2008) builds each component from the positive or negative part of a
+        singular vector pair of V, whichever carries more energy, which makes the initialization deterministic.
+
+        Args:
+            V (np.ndarray): The spectrogram of shape [KxN].
+            S (int): The number of sources to extract.
+            init (str): "random", "nndsvd" or "nndsvda".
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The initial W of shape [KxS] and H of shape [SxN].
+        """
+        K, N = np.shape(V)
+
+        if init == "random":
+            W = np.abs(self.__random_state.normal(loc=0, scale=2.5, size=(K, S)))
+            H = np.abs(self.__random_state.normal(loc=0, scale=2.5, size=(S, N)))
+            return W.astype(config.DTYPE), H.astype(config.DTYPE)
+
+        if S > min(K, N):
+            raise ValueError(
+                f"NNDSVD initialization supports at most {min(K, N)} sources for a spectrogram of shape {K}x{N}."
+            )
+
+        U, singular_values, Vt = np.linalg.svd(V, full_matrices=False)
+        W = np.zeros((K, S))
+        H = np.zeros((S, N))
+
+        # The leading singular vectors of a non-negative matrix can be chosen non-negative
+        W[:, 0] = np.sqrt(singular_values[0]) * np.abs(U[:, 0])
+        H[0, :] = np.sqrt(singular_values[0]) * np.abs(Vt[0, :])
+
+        for j in range(1, S):
+            x, y = U[:, j], Vt[j, :]
+            x_positive, x_negative = np.maximum(x, 0), np.maximum(-x, 0)
+            y_positive, y_negative = np.maximum(y, 0), np.maximum(-y, 0)
+            x_positive_norm = np.linalg.norm(x_positive)
+            y_positive_norm = np.linalg.norm(y_positive)
+            x_negative_norm = np.linalg.norm(x_negative)
+            y_negative_norm = np.linalg.norm(y_negative)
+
+            if x_positive_norm * y_positive_norm >= x_negative_norm * y_negative_norm:
+                u, v = x_positive, y_positive
+                u_norm, v_norm = x_positive_norm, y_positive_norm
+            else:
+                u, v = x_negative, y_negative
+                u_norm, v_norm = x_negative_norm, y_negative_norm
+
+            scale = np.sqrt(singular_values[j] * u_norm * v_norm)
+            if scale > 0:
+                W[:, j] = scale * u / u_norm
+                H[j, :] = scale * v / v_norm
+
+        if init == "nndsvda":
+            mean = np.mean(V)
+            W[W == 0] = mean
+            H[H == 0] = mean
+
+        return W.astype(config.DTYPE), H.astype(config.DTYPE)
+
     def __divergence(self, V, beta=2):
         """
         beta = 2 : Euclidean cost function
         beta = 1 : Kullback-Leibler cost function
         beta = 0 : Itakura-Saito cost function
         """
+        WH = self.__W @ self.__H
+
         if beta == 0:
-            return np.sum(
-                V / (self.__W @ self.__H) - math.log10(V / (self.__W @ self.__H)) - 1
-            )
+            return np.sum(V / WH - np.log(V / WH) - 1)
 
         if beta == 1:
-            return np.sum(
-                self.__V * math.log10(V / (self.__W @ self.__H))
-                + (self.__W @ self.__H - V)
-            )
+            return np.sum(V * np.log(V / WH) + (WH - V))
 
         if beta == 2:
-            return 1 / 2 * np.linalg.norm(self.__W @ self.__H - V)
+            WH -= V
+            return 1 / 2 * np.linalg.norm(WH)
 
     def __reconstruct_sounds(
         self, filtered_spectrograms: list[float], sound_stft_angle: np.ndarray
@@ -363,8 +921,8 @@ class NonNegativeMatrixFactorization:
             list: List of reconstructed audio signals.
         """
         reconstructed_sounds = []
-        for i in range(self.__S):
-            reconstruct = filtered_spectrograms[i] * np.exp(1j * sound_stft_angle)
+        for filtered_spectrogram in filtered_spectrograms:
+            reconstruct = filtered_spectrogram * np.exp(1j * sound_stft_angle)
             new_sound = librosa.istft(
                 reconstruct, n_fft=self.__FRAME, hop_length=self.__HOP
             )
@@ -374,16 +932,16 @@ class NonNegativeMatrixFactorization:
 
     def __generate_filtered_spectrograms(self):
         """
-        Generate filtered spectrograms for each audio source.
+        Generate filtered spectrograms for each audio source, from the sum of the components of the source.
 
         Returns:
             list: A list of filtered spectrograms for each source.
         """
         filtered_spectrograms = []
-        for i in range(self.__S):
+        for group in self.__component_groups:
             filtered_spectrogram = (
-                self.__W[:, [i]]
-                @ self.__H[[i], :]
+                self.__W[:, group]
+                @ self.__H[group, :]
                 / (self.__W @ self.__H + self.__EPSILON)
                 * self.__V
             )
@@ -1,6 +1,8 @@
-from pysoundlocalization.preprocessing.IFrequencyFilter import IFrequencyFilter
-from pysoundlocalization.core.Audio import Audio
-from scipy.signal import iirnotch, lfilter
+from pysoundlocalization.preprocessing.IFrequencyFilter import (
+    IFrequencyFilter,
+    notch_sos,
+)
+import numpy as np
 
 
 class NotchFilter(IFrequencyFilter):
@@ -16,27 +18,23 @@ class NotchFilter(IFrequencyFilter):
         self.__target_frequency = target_frequency
         self.__quality_factor = quality_factor
 
-    def apply(self, audio: Audio):
-        """
-        Apply the notch filter to the given audio signal.
+    def __str__(self) -> str:
+        return f"NotchFilter to remove {self.__target_frequency} Hz with quality factor {self.__quality_factor}"
 
-        Args:
-            audio (Audio): The audio object to apply the filter to. The filter modifies the audio in-place.
+    def get_sos(self, sample_rate: int) -> np.ndarray:
         """
-        print(
-            f"Applying NotchFilter to remove {self.__target_frequency} Hz with quality factor {self.__quality_factor}"
-        )
-
-        # Get the sample rate and compute the normalized frequency
-        sample_rate = audio.get_sample_rate()
-        normalized_frequency = self.__target_frequency / (0.5 * sample_rate)
+        Get the second-order sections of the notch filter for a sample rate.
 
-        # Create the notch filter coefficients
-        b, a = iirnotch(normalized_frequency, self.__quality_factor)
+        Args:
+            sample_rate (int): The sample rate in Hz.
 
-        # Apply the filter to the audio signal
-        audio.set_audio_signal(
-            audio_signal=lfilter(b, a, audio.get_audio_signal(index=0))
+        Returns:
+            np.ndarray: The second-order sections of shape (1, 6).
+        """
+        return notch_sos(
+            target_frequency=self.__target_frequency,
+            quality_factor=self.__quality_factor,
+            sample_rate=sample_rate,
         )
 
     def get_target_frequency(self) -> float:
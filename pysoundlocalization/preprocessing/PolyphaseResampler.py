@@ -0,0 +1,189 @@
+from functools import lru_cache
+from math import gcd
+import numpy as np
+from scipy.signal import firwin, resample_poly
+
+
+class PolyphaseResampler:
+    """
+    Rational polyphase resampler from one sample rate to another, in the style of scipy.signal.resample_poly.
+
+    The anti-aliasing filter is designed once per reduced (up, down) ratio and cached. Whole signals, or batches of
+    signals stacked along the first axes, are resampled with resample(). Block-wise input is resampled with process()
+    and flush(), which carry the filter state across blocks and produce the same samples as resample() on the
+    concatenated blocks.
+
+    Args:
+        orig_sr (int): The sample rate of the input in Hz.
+        target_sr (int): The sample rate of the output in Hz.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        if orig_sr <= 0 or target_sr <= 0:
+            raise ValueError("Sample rates must be positive.")
+
+        divisor = gcd(int(orig_sr), int(target_sr))
+        self.__orig_sr = orig_sr
+        self.__target_sr = target_sr
+        self.__up = int(target_sr) // divisor
+        self.__down = int(orig_sr) // divisor
+        self.__filter = _design_filter(up=self.__up, down=self.__down)
+        self.__half_len = (len(self.__filter) - 1) // 2
+
+        # Polyphase decomposition of the filter (scaled by up): row p holds the taps of phase p
+        self.__num_taps = -(-len(self.__filter) // self.__up)
+        taps = np.zeros(self.__num_taps * self.__up)
+        taps[: len(self.__filter)] = self.__filter * self.__up
+        self.__phases = taps.reshape(self.__num_taps, self.__up).T
+
+        self.reset()
+
+    def resample(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Resample whole signals along their last axis.
+
+        Args:
+            signals (np.ndarray): The signals of shape (..., n_samples).
+
+        Returns:
+            np.ndarray: The resampled signals of shape (..., ceil(n_samples * target_sr / orig_sr)).
+        """
+        if self.__up == self.__down:
+            return np.array(signals, copy=True)
+        return resample_poly(
+            signals, self.__up, self.__down, axis=-1, window=self.__filter
+        )
+
+    def reset(self) -> None:
+        """
+        Reset the state of block-wise resampling, e.g. to start a new stream.
+        """
+        self.__buffer: np.ndarray | None = None
+        # Absolute input index of the first sample in the buffer (negative indices are zeros before the stream)
+        self.__buffer_start = -self.__num_taps
+        self.__num_inputs = 0
+        self.__num_outputs = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of a stream. The output lags the input by the half-length of the filter.
+
+        Args:
+            block (np.ndarray): The next input samples of shape (..., n_samples). All blocks of a stream must have the same leading shape.
+
+        Returns:
+            np.ndarray: All output samples that can be computed from the input so far, of shape (..., n_outputs).
+        """
+        block = np.asarray(block)
+        if self.__buffer is None:
+            self.__buffer = np.zeros(block.shape[:-1] + (self.__num_taps,), block.dtype)
+        self.__buffer = np.concatenate((self.__buffer, block), axis=-1)
+        self.__num_inputs += block.shape[-1]
+
+        # Output m needs the inputs up to index (m * down + half_len) // up
+        last_output = (
+            self.__num_inputs * self.__up - 1 - self.__half_len
+        ) // self.__down
+        return self.__produce(num_outputs=last_output + 1 - self.__num_outputs)
+
+    def flush(self) -> np.ndarray:
+        """
+        Finish the stream by computing the remaining output samples, assuming zeros after the last block.
+
+        Returns:
+            np.ndarray: The remaining output samples of shape (..., n_outputs).
+        """
+        if self.__buffer is None:
+            return np.zeros(0)
+
+        total_outputs = -(-self.__num_inputs * self.__up // self.__down)
+        num_outputs = total_outputs - self.__num_outputs
+        padding_length = (
+            ((total_outputs - 1) * self.__down + self.__half_len) // self.__up
+            + 1
+            - self.__num_inputs
+        )
+        if padding_length > 0:
+            padding = np.zeros(
+                self.__buffer.shape[:-1] + (padding_length,), self.__buffer.dtype
+            )
+            self.__buffer = np.concatenate((self.__buffer, padding), axis=-1)
+
+        outputs = self.__produce(num_outputs=num_outputs)
+        self.reset()
+        return outputs
+
+    def __produce(self, num_outputs: int) -> np.ndarray:
+        """
+        Compute the next output samples from the buffered input and drop the input that is no longer needed.
+
+        Args:
+            num_outputs (int): The number of output samples to compute.
+
+        Returns:
+            np.ndarray: The output samples of shape (..., num_outputs).
+        """
+        num_outputs = max(num_outputs, 0)
+        m = self.__num_outputs + np.arange(num_outputs)
+        position = m * self.__down + self.__half_len
+        newest = position // self.__up - self.__buffer_start
+        indices = newest[:, np.newaxis] - np.arange(self.__num_taps)
+        taps = self.__phases[position % self.__up]
+        outputs = np.einsum("...mt,mt->...m", self.__buffer[..., indices], taps)
+
+        self.__num_outputs += num_outputs
+
+        # Keep only the inputs needed by the next output
+        next_position = self.__num_outputs * self.__down + self.__half_len
+        oldest = next_position // self.__up - self.__num_taps + 1 - self.__buffer_start
+        oldest = min(max(oldest, 0), self.__buffer.shape[-1])
+        self.__buffer = self.__buffer[..., oldest:]
+        self.__buffer_start += oldest
+
+        return outputs
+
+    def get_ratio(self) -> tuple[int, int]:
+        """
+        Get the reduced upsampling and downsampling factors.
+
+        Returns:
+            tuple[int, int]: The (up, down) factors.
+        """
+        return self.__up, self.__down
+
+    def get_orig_sr(self) -> int:
+        """
+        Get the sample rate of the input.
+
+        Returns:
+            int: The sample rate of the input in Hz.
+        """
+        return self.__orig_sr
+
+    def get_target_sr(self) -> int:
+        """
+        Get the sample rate of the output.
+
+        Returns:
+            int: The sample rate of the output in Hz.
+        """
+        return self.__target_sr
+
+
+@lru_cache(maxsize=32)
+def _design_filter(up: int, down: int) -> np.ndarray:
+    """
+    Design the linear-phase low-pass FIR filter of resample_poly for a reduced (up, down) ratio.
+
+    Args:
+        up (int): The upsampling factor.
+        down (int): The downsampling factor.
+
+    Returns:
+        np.ndarray: The read-only filter taps (not yet scaled by up).
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    taps.setflags(write=False)
+    return taps
@@ -1,5 +1,8 @@
 from pysoundlocalization.core.Environment import Environment
 from pysoundlocalization.core.Audio import Audio
+from pysoundlocalization.preprocessing.PolyphaseResampler import PolyphaseResampler
+import pysoundlocalization.config as config
+import numpy as np
 
 
 class SampleRateConverter:
@@ -25,22 +28,27 @@ class SampleRateConverter:
         )
 
     @staticmethod
-    def convert_all_to_lowest_sample_rate(environment: Environment) -> None:
+    def convert_all_to_lowest_sample_rate(
+        environment: Environment, backend: str = "librosa"
+    ) -> None:
         """
         Convert all audio files in the given environment to the lowest sample rate of any existing mic audio.
 
         Args:
             environment: An instance of the Environment class.
+            backend (str): "librosa" resamples each mic separately. "polyphase" resamples all mics with the same
+                sample rate and length as one 2-D batch with a cached polyphase filter. Defaults to "librosa".
         """
         lowest_rate = SampleRateConverter.get_lowest_sample_rate(
             environment=environment
         )
-        for mic in environment.get_mics():
-            mic.get_audio().resample_audio(target_rate=lowest_rate)
+        SampleRateConverter.convert_all_to_defined_sample_rate(
+            environment=environment, target_sample_rate=lowest_rate, backend=backend
+        )
 
     @staticmethod
     def convert_all_to_defined_sample_rate(
-        environment: Environment, target_sample_rate: int
+        environment: Environment, target_sample_rate: int, backend: str = "librosa"
     ) -> None:
         """
         Convert all audio files in the given environment to a defined sample rate.
@@ -48,9 +56,53 @@ class SampleRateConverter:
         Args:
             environment: An instance of the Environment class.
             target_sample_rate (int): The sample rate to convert to.
+            backend (str): "librosa" resamples each mic separately. "polyphase" resamples all mics with the same
+                sample rate and length as one 2-D batch with a cached polyphase filter. Defaults to "librosa".
         """
+        if backend == "polyphase":
+            SampleRateConverter.__resample_batch(
+                audios=[mic.get_audio() for mic in environment.get_mics()],
+                target_sample_rate=target_sample_rate,
+            )
+            return
+
         for mic in environment.get_mics():
-            mic.get_audio().resample_audio(target_rate=target_sample_rate)
+            mic.get_audio().resample_audio(
+                target_rate=target_sample_rate, backend=backend
+            )
+
+    @staticmethod
+    def __resample_batch(audios: list[Audio], target_sample_rate: int) -> None:
+        """
+        Resample audios to a target sample rate, batching all audios with the same sample rate and chunk layout.
+
+        Args:
+            audios (list[Audio]): The audios to resample.
+            target_sample_rate (int): The sample rate to convert to.
+        """
+        groups: dict[tuple[int, tuple[int, ...]], list[Audio]] = {}
+        for audio in audios:
+            if audio.get_sample_rate() == target_sample_rate:
+                continue
+            key = (audio.get_sample_rate(), audio.get_audio_signal_chunked().shape)
+            groups.setdefault(key, []).append(audio)
+
+        for (sample_rate, _), group in groups.items():
+            print(
+                f"Resampling {len(group)} audios from {sample_rate} Hz to {target_sample_rate} Hz..."
+            )
+            resampler = PolyphaseResampler(
+                orig_sr=sample_rate, target_sr=target_sample_rate
+            )
+            resampled = resampler.resample(
+                np.stack([audio.get_audio_signal_chunked() for audio in group])
+            ).astype(config.DTYPE, copy=False)
+
+            for audio, audio_signal_chunked in zip(group, resampled):
+                audio.set_audio_signal_chunked(
+                    audio_signal_chunked=audio_signal_chunked
+                )
+                audio.set_sample_rate(target_sample_rate)
 
     @staticmethod
     def convert_all_to_sample_rate_of_audio_file(
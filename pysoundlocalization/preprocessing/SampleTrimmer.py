@@ -120,9 +120,10 @@ class SampleTrimmer:
         start_sample = max(0, min(start_sample, total_samples))
         end_sample = max(0, min(end_sample, total_samples))
 
-        # Slice the audio signal between start and end samples
+        # Slice the audio signal between start and end samples. Reading only these samples
+        # avoids loading the entire audio signal of a lazily opened audio file.
         audio.set_audio_signal(
-            audio_signal=audio.get_audio_signal_unchunked()[start_sample:end_sample]
+            audio_signal=audio.read_samples(start=start_sample, stop=end_sample)
         )
 
         return audio
@@ -145,9 +146,10 @@ class SampleTrimmer:
         start_sample = max(0, min(start_sample, total_samples))
         end_sample = max(0, min(end_sample, total_samples))
 
-        # Slice the audio signal between start and end samples
+        # Slice the audio signal between start and end samples. Reading only these samples
+        # avoids loading the entire audio signal of a lazily opened audio file.
         audio.set_audio_signal(
-            audio_signal=audio.get_audio_signal_unchunked()[start_sample:end_sample]
+            audio_signal=audio.read_samples(start=start_sample, stop=end_sample)
         )
 
         return audio
@@ -3,6 +3,7 @@ from pysoundlocalization.core.Environment import Environment
 from pysoundlocalization.core.Audio import Audio
 from pysoundlocalization.preprocessing.AudioNormalizer import AudioNormalizer
 from pysoundlocalization.config import DEFAULT_SOUND_SPEED
+import pysoundlocalization.config as config
 
 
 def generate_audios(
@@ -75,7 +76,7 @@ def generate_audios(
         max_sample_index + int(default_sound_duration * sample_rate) + max_delay_samples
     )
 
-    mic_audio = [np.zeros(total_samples) for _ in range(num_mics)]
+    mic_audio = [np.zeros(total_samples, dtype=config.DTYPE) for _ in range(num_mics)]
 
     # Default loudness mix if not provided
     if loudness_mix is None: